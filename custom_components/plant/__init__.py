@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
+from operator import attrgetter
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
@@ -23,7 +24,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     Platform,
 )
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import (
     area_registry as ar,
 )
@@ -36,8 +37,10 @@ from homeassistant.helpers import (
 from homeassistant.helpers import (
     entity_registry as er,
 )
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.event import async_track_entity_registry_updated_event
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import group
@@ -72,6 +75,11 @@ from .const import (
     ATTR_WEATHER_ENTITY,
     CONF_SMART_WATERING,
     CONF_WATERING,
+    DATA_HELPER,
+    DATA_INDEX,
+    DATA_NOTIFICATION_LISTENER,
+    DATA_PLANT_BY_UNIQUE_ID,
+    DATA_SENSOR_BY_UNIQUE_ID,
     DATA_SOURCE,
     DOMAIN,
     DOMAIN_PLANTBOOK,
@@ -87,7 +95,10 @@ from .const import (
     FLOW_SENSOR_ROOM_TEMPERATURE,
     FLOW_TEMPERATURE_TRIGGER,
     FLOW_WEATHER_ENTITY,
+    OPB_CATEGORY_KEYS,
+    OPB_COMMON_NAME_KEYS,
     OPB_DISPLAY_PID,
+    OPB_ORIGIN_KEYS,
     READING_CONDUCTIVITY,
     READING_DLI,
     READING_HUMIDITY,
@@ -102,7 +113,7 @@ from .const import (
     STATE_HIGH,
     STATE_LOW,
 )
-from .plant_helpers import PlantHelper
+from .plant_helpers import PlantHelper, opb_first, opb_to_string
 from .watering import days_until, next_watering
 
 _LOGGER = logging.getLogger(__name__)
@@ -111,6 +122,47 @@ PLATFORMS = [Platform.NUMBER, Platform.SENSOR]
 
 SERVICE_REMOVE_PLANT = "remove_plant"
 
+# Getters for the entities that belong to a plant
+_THRESHOLD_ENTITIES = attrgetter(
+    "max_conductivity",
+    "max_dli",
+    "max_humidity",
+    "max_illuminance",
+    "max_moisture",
+    "max_temperature",
+    "min_conductivity",
+    "min_dli",
+    "min_humidity",
+    "min_illuminance",
+    "min_moisture",
+    "min_temperature",
+)
+_METER_ENTITIES = attrgetter(
+    "sensor_conductivity",
+    "sensor_humidity",
+    "sensor_illuminance",
+    "sensor_moisture",
+    "sensor_temperature",
+)
+_INTEGRAL_ENTITIES = attrgetter("dli", "ppfd", "total_integral")
+
+# States without a usable value
+UNAVAILABLE_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+# Same as above, but also covering a missing state
+_BAD_STATES = frozenset((None, STATE_UNKNOWN, STATE_UNAVAILABLE))
+# Weather conditions that count as natural watering, now or in the forecast
+_RAINING_CONDITIONS = frozenset(("rainy", "pouring", "hail"))
+_RAINY_CONDITIONS = _RAINING_CONDITIONS | {"snowy"}
+
+# Attribute keys used in the plant state attributes
+ATTR_SPECIES_ORIGINAL = f"{ATTR_SPECIES}_original"
+ATTR_MOISTURE_STATUS = f"{ATTR_MOISTURE}_status"
+ATTR_TEMPERATURE_STATUS = f"{ATTR_TEMPERATURE}_status"
+ATTR_CONDUCTIVITY_STATUS = f"{ATTR_CONDUCTIVITY}_status"
+ATTR_ILLUMINANCE_STATUS = f"{ATTR_ILLUMINANCE}_status"
+ATTR_HUMIDITY_STATUS = f"{ATTR_HUMIDITY}_status"
+ATTR_DLI_STATUS = f"{ATTR_DLI}_status"
+
 # Use this during testing to generate some dummy-sensors
 # to provide random readings for temperature, moisture etc.
 #
@@ -147,9 +199,113 @@ USE_DUMMY_SENSORS = False
 @callback
 def _async_find_matching_config_entry(hass: HomeAssistant) -> ConfigEntry | None:
     """Check if there are migrated entities"""
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        if entry.source == SOURCE_IMPORT:
-            return entry
+    return next(
+        (
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.source == SOURCE_IMPORT
+        ),
+        None,
+    )
+
+
+@callback
+def _async_get_plant_helper(hass: HomeAssistant) -> PlantHelper:
+    """Return the PlantHelper shared by all plants"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_HELPER not in domain_data:
+        domain_data[DATA_HELPER] = PlantHelper(hass)
+    return domain_data[DATA_HELPER]
+
+
+def _service_entity_ids(call: ServiceCall) -> set[str]:
+    """Return the entity_ids of a service call as a set"""
+    return set(cv.ensure_list(call.data.get("entity_id")))
+
+
+@callback
+def _indexed_entity(hass: HomeAssistant, key: str, entity_id: str | None):
+    """Return the indexed plant or meter of an entity_id
+
+    The index is keyed by unique_id, so renamed entities are resolved through
+    the entity registry.
+    """
+    index = hass.data.get(DOMAIN, {}).get(DATA_INDEX)
+    if not index or not entity_id:
+        return None
+    registry_entry = er.async_get(hass).async_get(entity_id)
+    if registry_entry is not None:
+        if registry_entry.platform != DOMAIN:
+            return None
+        return index[key].get(registry_entry.unique_id)
+    # Not in the registry, compare the live entity_ids instead
+    for entity in index[key].values():
+        if entity.entity_id == entity_id:
+            return entity
+    return None
+
+
+def _coerce_days(value, default: float) -> float:
+    """Return a number of days from a stored value like 7, 7.0, "7" or "7 days"."""
+    if type(value) in (int, float):
+        return value
+    try:
+        if isinstance(value, str):
+            return float(value.split(" ", 1)[0])
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _parse_datetime(value) -> datetime | None:
+    """Return a naive local datetime restored from an isoformat string
+
+    Anything that can not be parsed is discarded, so the rest of the code can
+    use the value without further checks.
+    """
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return None
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Return a datetime as an isoformat string for the state attributes"""
+    return value.isoformat() if value else None
+
+
+def _usable_state(states_get, *entity_ids: str | None) -> str | None:
+    """Return the first state of entity_ids that is not unknown or unavailable"""
+    for entity_id in entity_ids:
+        if entity_id:
+            state = states_get(entity_id)
+            if state and state.state not in UNAVAILABLE_STATES:
+                return state.state
+    return None
+
+
+def _entity_id(entity: Entity | None) -> str | None:
+    """Return the current entity_id of an optional entity"""
+    return entity.entity_id if entity is not None else None
+
+
+def _state_or_default(entity: Entity | None, default):
+    """Return the state of an entity, or default if there is no entity"""
+    return entity.state if entity is not None else default
+
+
+def _threshold_value(threshold) -> float | None:
+    """Return the numeric value of a threshold entity (or a plain number)"""
+    if threshold is None:
+        return None
+    try:
+        return float(getattr(threshold, "state", threshold))
+    except (ValueError, TypeError):
+        return None
 
 
 async def async_migrate_plant(hass: HomeAssistant, plant_id: str, config: dict) -> None:
@@ -157,7 +313,7 @@ async def async_migrate_plant(hass: HomeAssistant, plant_id: str, config: dict)
 
     if ATTR_NAME not in config:
         config[ATTR_NAME] = plant_id.replace("_", " ").capitalize()
-    plant_helper = PlantHelper(hass)
+    plant_helper = _async_get_plant_helper(hass)
     plant_config = await plant_helper.generate_configentry(config=config)
     hass.async_create_task(
         hass.config_entries.flow.async_init(
@@ -193,6 +349,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     component = hass.data[DOMAIN]["component"]
     await component.async_add_entities(plant_entities)
 
+    # Index the plant and its meters by unique_id for the service calls
+    index = hass.data[DOMAIN].setdefault(
+        DATA_INDEX, {DATA_PLANT_BY_UNIQUE_ID: {}, DATA_SENSOR_BY_UNIQUE_ID: {}}
+    )
+    index[DATA_PLANT_BY_UNIQUE_ID][plant.unique_id] = plant
+    for sensor in hass.data[DOMAIN][entry.entry_id].get(ATTR_SENSORS, []):
+        index[DATA_SENSOR_BY_UNIQUE_ID][sensor.unique_id] = sensor
+
     # Add the rest of the entities to device registry together with plant
     device_id = plant.device_id
     await _plant_add_to_device_registry(hass, plant_entities, device_id)
@@ -202,10 +366,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     #
     # Set up utility sensor
-    hass.data.setdefault(DATA_UTILITY, {})
-    hass.data[DATA_UTILITY].setdefault(entry.entry_id, {})
-    hass.data[DATA_UTILITY][entry.entry_id].setdefault(DATA_TARIFF_SENSORS, [])
-    hass.data[DATA_UTILITY][entry.entry_id][DATA_TARIFF_SENSORS].append(plant.dli)
+    utility_data = hass.data.setdefault(DATA_UTILITY, {}).setdefault(entry.entry_id, {})
+    utility_data.setdefault(DATA_TARIFF_SENSORS, []).append(plant.dli)
 
     #
     # Service call to replace sensors
@@ -213,14 +375,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Replace a sensor entity within a plant device"""
         meter_entity = call.data.get("meter_entity")
         new_sensor = call.data.get("new_sensor")
-        found = False
-        for entry_id in hass.data[DOMAIN]:
-            if ATTR_SENSORS in hass.data[DOMAIN][entry_id]:
-                for sensor in hass.data[DOMAIN][entry_id][ATTR_SENSORS]:
-                    if sensor.entity_id == meter_entity:
-                        found = True
-                        break
-        if not found:
+        plant_meter = _indexed_entity(hass, DATA_SENSOR_BY_UNIQUE_ID, meter_entity)
+        if plant_meter is None:
             _LOGGER.warning(
                 "Refuse to update non-%s entities: %s", DOMAIN, meter_entity
             )
@@ -255,15 +411,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
             meter_entity,
             new_sensor,
         )
-        for key in hass.data[DOMAIN]:
-            if ATTR_SENSORS in hass.data[DOMAIN][key]:
-                meters = hass.data[DOMAIN][key][ATTR_SENSORS]
-                for meter in meters:
-                    if meter.entity_id == meter_entity:
-                        meter.replace_external_sensor(new_sensor)
+        plant_meter.replace_external_sensor(new_sensor)
         return
 
-    hass.services.async_register(DOMAIN, SERVICE_REPLACE_SENSOR, replace_sensor)
+    if not hass.services.has_service(DOMAIN, SERVICE_REPLACE_SENSOR):
+        hass.services.async_register(DOMAIN, SERVICE_REPLACE_SENSOR, replace_sensor)
     websocket_api.async_register_command(hass, ws_get_info)
     plant.async_schedule_update_ha_state(True)
 
@@ -284,40 +436,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
                     limit=30,
                 )
 
-    # Register services
-    if True:
+    # Register services and listeners once for all plants
+    if not hass.services.has_service(DOMAIN, SERVICE_WATERED):
 
         async def watered(call: ServiceCall) -> None:
             """Service call to mark a plant as watered."""
-            entity_ids = call.data.get("entity_id")
+            entity_ids = _service_entity_ids(call)
             if not entity_ids:
                 return
-            if isinstance(entity_ids, str):
-                entity_ids = [entity_ids]
 
             _LOGGER.debug("Service watered called for %s", entity_ids)
 
-            for entry_id in hass.data[DOMAIN]:
-                if not isinstance(hass.data[DOMAIN][entry_id], dict):
-                    continue
-                plant_obj = hass.data[DOMAIN][entry_id].get(ATTR_PLANT)
-                if plant_obj and plant_obj.entity_id in entity_ids:
+            for entity_id in entity_ids:
+                plant_obj = _indexed_entity(hass, DATA_PLANT_BY_UNIQUE_ID, entity_id)
+                if plant_obj:
                     _LOGGER.info("Marking %s as watered", plant_obj.entity_id)
                     plant_obj.async_watered()
 
         async def snooze(call: ServiceCall) -> None:
             """Service call to snooze watering notification."""
-            entity_ids = call.data.get("entity_id")
+            entity_ids = _service_entity_ids(call)
             if not entity_ids:
                 return
-            if isinstance(entity_ids, str):
-                entity_ids = [entity_ids]
-
-            for entry_id in hass.data[DOMAIN]:
-                if not isinstance(hass.data[DOMAIN][entry_id], dict):
-                    continue
-                plant_obj = hass.data[DOMAIN][entry_id].get(ATTR_PLANT)
-                if plant_obj and plant_obj.entity_id in entity_ids:
+
+            for entity_id in entity_ids:
+                plant_obj = _indexed_entity(hass, DATA_PLANT_BY_UNIQUE_ID, entity_id)
+                if plant_obj:
                     plant_obj.async_snooze()
 
         hass.services.async_register(
@@ -329,17 +473,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
         async def skip_watering(call: ServiceCall) -> None:
             """Service call to skip a watering."""
-            entity_ids = call.data.get("entity_id")
+            entity_ids = _service_entity_ids(call)
             if not entity_ids:
                 return
-            if isinstance(entity_ids, str):
-                entity_ids = [entity_ids]
-
-            for entry_id in hass.data[DOMAIN]:
-                if not isinstance(hass.data[DOMAIN][entry_id], dict):
-                    continue
-                plant_obj = hass.data[DOMAIN][entry_id].get(ATTR_PLANT)
-                if plant_obj and plant_obj.entity_id in entity_ids:
+
+            for entity_id in entity_ids:
+                plant_obj = _indexed_entity(hass, DATA_PLANT_BY_UNIQUE_ID, entity_id)
+                if plant_obj:
                     _LOGGER.info("Marking %s as skipped", plant_obj.entity_id)
                     plant_obj.async_skip_watering()
 
@@ -352,16 +492,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
         async def update_plants(call: ServiceCall) -> None:
             """Service call to force update all plants."""
-            entity_ids = call.data.get("entity_id")
+            entity_ids = _service_entity_ids(call)
 
-            for entry_id in hass.data[DOMAIN]:
-                if not isinstance(hass.data[DOMAIN][entry_id], dict):
-                    continue
-                plant_obj = hass.data[DOMAIN][entry_id].get(ATTR_PLANT)
-                if plant_obj:
-                    if not entity_ids or plant_obj.entity_id in entity_ids:
-                        _LOGGER.info("Forcing update for %s", plant_obj.entity_id)
-                        await plant_obj.async_update_ha_state(force_refresh=True)
+            plant_by_unique_id = hass.data[DOMAIN][DATA_INDEX][DATA_PLANT_BY_UNIQUE_ID]
+            for plant_obj in list(plant_by_unique_id.values()):
+                if not entity_ids or plant_obj.entity_id in entity_ids:
+                    _LOGGER.info("Forcing update for %s", plant_obj.entity_id)
+                    await plant_obj.async_update_ha_state(force_refresh=True)
 
         hass.services.async_register(
             DOMAIN,
@@ -372,11 +509,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
         async def remove_plant(call: ServiceCall) -> None:
             """Service call to remove a plant completely."""
-            entity_ids = call.data.get("entity_id")
+            entity_ids = _service_entity_ids(call)
             if not entity_ids:
                 return
-            if isinstance(entity_ids, str):
-                entity_ids = [entity_ids]
 
             ent_reg = er.async_get(hass)
             for entity_id in entity_ids:
@@ -391,22 +526,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
                     )
                     await hass.config_entries.async_remove(entity_entry.config_entry_id)
                 else:
-                    # Fallback to searching hass.data
+                    # Fallback to the plant index in hass.data
                     _LOGGER.debug(
                         "Entity not found in registry, searching in hass.data"
                     )
-                    for entry_id in list(hass.data.get(DOMAIN, {}).keys()):
-                        if not isinstance(hass.data[DOMAIN][entry_id], dict):
-                            continue
-                        plant_obj = hass.data[DOMAIN][entry_id].get(ATTR_PLANT)
-                        if plant_obj and plant_obj.entity_id == entity_id:
-                            _LOGGER.info(
-                                "Removing plant %s via hass.data search (ConfigEntry: %s)",
-                                entity_id,
-                                entry_id,
-                            )
-                            await hass.config_entries.async_remove(entry_id)
-                            break
+                    plant_obj = _indexed_entity(
+                        hass, DATA_PLANT_BY_UNIQUE_ID, entity_id
+                    )
+                    if plant_obj:
+                        # The unique_id of a plant is the entry_id of its config entry
+                        _LOGGER.info(
+                            "Removing plant %s via hass.data search (ConfigEntry: %s)",
+                            entity_id,
+                            plant_obj.unique_id,
+                        )
+                        await hass.config_entries.async_remove(plant_obj.unique_id)
 
         hass.services.async_register(
             DOMAIN,
@@ -415,20 +549,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
             schema=cv.make_entity_service_schema({}),
         )
 
-    async def handle_notification_action(event) -> None:
-        """Handle actionable notification events."""
-        action = event.data.get("action")
-        entity_id = event.data.get("entity_id")
-        if action == "PLANT_WATERED":
-            await hass.services.async_call(
-                DOMAIN, SERVICE_WATERED, {"entity_id": entity_id}
-            )
-        elif action == "PLANT_SNOOZE":
-            await hass.services.async_call(
-                DOMAIN, SERVICE_SNOOZE, {"entity_id": entity_id}
-            )
+        async def handle_notification_action(event) -> None:
+            """Handle actionable notification events."""
+            action = event.data.get("action")
+            entity_id = event.data.get("entity_id")
+            if action == "PLANT_WATERED":
+                await hass.services.async_call(
+                    DOMAIN, SERVICE_WATERED, {"entity_id": entity_id}
+                )
+            elif action == "PLANT_SNOOZE":
+                await hass.services.async_call(
+                    DOMAIN, SERVICE_SNOOZE, {"entity_id": entity_id}
+                )
 
-    hass.bus.async_listen("mobile_app_notification_action", handle_notification_action)
+        hass.data[DOMAIN][DATA_NOTIFICATION_LISTENER] = hass.bus.async_listen(
+            "mobile_app_notification_action", handle_notification_action
+        )
 
     return True
 
@@ -442,7 +578,10 @@ async def _plant_add_to_device_registry(
     # device_id when adding the entities.
     erreg = er.async_get(hass)
     for entity in plant_entities:
-        erreg.async_update_entity(entity.registry_entry.entity_id, device_id=device_id)
+        registry_entry = entity.registry_entry
+        # Only touch the registry if the entity is not already on the device
+        if registry_entry and registry_entry.device_id != device_id:
+            erreg.async_update_entity(registry_entry.entity_id, device_id=device_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -453,21 +592,38 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        index = hass.data[DOMAIN].get(DATA_INDEX)
+        if index:
+            entry_data = hass.data[DOMAIN].get(entry.entry_id, {})
+            for sensor in entry_data.get(ATTR_SENSORS, []):
+                index[DATA_SENSOR_BY_UNIQUE_ID].pop(sensor.unique_id, None)
+            if plant:
+                index[DATA_PLANT_BY_UNIQUE_ID].pop(plant.unique_id, None)
+
         if plant:
             _LOGGER.debug("Removing plant entity %s", plant.entity_id)
             await plant.async_remove()
 
-        hass.data[DOMAIN].pop(entry.entry_id)
-        hass.data[DATA_UTILITY].pop(entry.entry_id)
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data.get(DATA_UTILITY, {}).pop(entry.entry_id, None)
         _LOGGER.info(hass.data[DOMAIN])
-        for entry_id in list(hass.data[DOMAIN].keys()):
-            if len(hass.data[DOMAIN][entry_id]) == 0:
-                _LOGGER.info("Removing entry %s", entry_id)
-                del hass.data[DOMAIN][entry_id]
-        if len(hass.data[DOMAIN]) == 0:
+        # The plant index tells us if this was the last plant
+        if not hass.data[DOMAIN].get(DATA_INDEX, {}).get(DATA_PLANT_BY_UNIQUE_ID):
             _LOGGER.info("Removing domain %s", DOMAIN)
-            hass.services.async_remove(DOMAIN, SERVICE_REPLACE_SENSOR)
-            del hass.data[DOMAIN]
+            for service in (
+                SERVICE_REPLACE_SENSOR,
+                SERVICE_WATERED,
+                SERVICE_SNOOZE,
+                SERVICE_SKIP_WATERING,
+                SERVICE_UPDATE_PLANTS,
+                SERVICE_REMOVE_PLANT,
+            ):
+                hass.services.async_remove(DOMAIN, service)
+            if DATA_NOTIFICATION_LISTENER in hass.data[DOMAIN]:
+                hass.data[DOMAIN].pop(DATA_NOTIFICATION_LISTENER)()
+            # The entity component and the plant helper are shared by the
+            # domain and are reused when a plant is set up again
+            hass.data[DOMAIN].pop(DATA_INDEX, None)
     return unload_ok
 
 
@@ -484,29 +640,18 @@ def ws_get_info(
     """Handle the websocket command."""
     # _LOGGER.debug("Got websocket request: %s", msg)
 
-    if DOMAIN not in hass.data:
+    plant_entity = _indexed_entity(hass, DATA_PLANT_BY_UNIQUE_ID, msg["entity_id"])
+    if plant_entity is None:
         connection.send_error(
-            msg["id"], "domain_not_found", f"Domain {DOMAIN} not found"
+            msg["id"], "entity_not_found", f"Entity {msg['entity_id']} not found"
         )
         return
 
-    for key in hass.data[DOMAIN]:
-        if not ATTR_PLANT in hass.data[DOMAIN][key]:
-            continue
-        plant_entity = hass.data[DOMAIN][key][ATTR_PLANT]
-        if plant_entity.entity_id == msg["entity_id"]:
-            # _LOGGER.debug("Sending websocket response: %s", plant_entity.websocket_info)
-            try:
-                connection.send_result(
-                    msg["id"], {"result": plant_entity.websocket_info}
-                )
-            except ValueError as e:
-                _LOGGER.warning(e)
-            return
-    connection.send_error(
-        msg["id"], "entity_not_found", f"Entity {msg['entity_id']} not found"
-    )
-    return
+    # _LOGGER.debug("Sending websocket response: %s", plant_entity.websocket_info)
+    try:
+        connection.send_result(msg["id"], {"result": plant_entity.websocket_info})
+    except ValueError as e:
+        _LOGGER.warning(e)
 
 
 class PlantDevice(RestoreEntity):
@@ -519,9 +664,11 @@ class PlantDevice(RestoreEntity):
         self._attr_name = config.data[FLOW_PLANT_INFO][ATTR_NAME]
         self._config_entries = []
         self._data_source = config.data[FLOW_PLANT_INFO].get(DATA_SOURCE)
-        self.last_watered = None
-        self.snooze_until = None
-        self.last_notified = None
+        self.last_watered: datetime | None = None
+        self.snooze_until: datetime | None = None
+        self.last_notified: datetime | None = None
+        # Set while a notification is queued, so update ticks don't queue another
+        self._notification_pending = False
 
         # Get entity_picture from options or from initial config
         self._attr_entity_picture = self._config.options.get(
@@ -555,6 +702,19 @@ class PlantDevice(RestoreEntity):
         self._last_moisture: float | None = None
         self._watering_explanation: str = "Ideal conditions"
         self._device_id = None
+        # Registries are singletons, so only look them up once
+        self._device_registry = dr.async_get(hass)
+        self._area_registry = ar.async_get(hass)
+        self._cached_area_name: str | None = None
+        self._area_cache_valid = False
+        # Bursts of watering service calls only write the state once more
+        self._write_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=0.25,
+            immediate=True,
+            function=self.async_write_ha_state,
+        )
 
         self._check_days = None
 
@@ -602,16 +762,16 @@ class PlantDevice(RestoreEntity):
         self.outside = self._config.options.get(
             FLOW_OUTSIDE, config.data[FLOW_PLANT_INFO].get(FLOW_OUTSIDE, False)
         )
-        if not isinstance(self.watering_days, (int, float)):
-            try:
-                if isinstance(self.watering_days, str):
-                    self.watering_days = float(self.watering_days.split(" ")[0])
-                else:
-                    self.watering_days = float(self.watering_days)
-            except (ValueError, TypeError, IndexError):
-                self.watering_days = 7
+        self.watering_days = _coerce_days(self.watering_days, default=7)
         self.next_watering = "0 j"
+        self._next_watering_days: int = 0
         self._watering_explanation = ""
+        # Readings and status of the last update, reused by the watering calculation
+        self._watering_inputs: tuple = (None, None, None, None, None)
+        self._sensor_problem = False
+        self._known_state = False
+        # (last_updated, rainy) of the last scanned weather forecast
+        self._weather_cache: tuple[datetime | None, bool] = (None, False)
 
         self.dli = None
         self.micro_dli = None
@@ -696,10 +856,7 @@ class PlantDevice(RestoreEntity):
 
         # Helper to get float state
         def get_val(sensor_obj):
-            if sensor_obj and sensor_obj.state not in (
-                STATE_UNKNOWN,
-                STATE_UNAVAILABLE,
-            ):
+            if sensor_obj and sensor_obj.state not in UNAVAILABLE_STATES:
                 try:
                     return float(sensor_obj.state)
                 except (ValueError, TypeError):
@@ -709,15 +866,15 @@ class PlantDevice(RestoreEntity):
         # Check Temperature
         val = get_val(self.sensor_temperature)
         if val is not None:
-            v_min = getattr(self.min_temperature, "state", 10)
-            v_max = getattr(self.max_temperature, "state", 35)
+            v_min = _state_or_default(self.min_temperature, 10)
+            v_max = _state_or_default(self.max_temperature, 35)
             scores.append(self._calculate_range_score(val, float(v_min), float(v_max)))
 
         # Check Humidity
         val = get_val(self.sensor_humidity)
         if val is not None:
-            v_min = getattr(self.min_humidity, "state", 30)
-            v_max = getattr(self.max_humidity, "state", 80)
+            v_min = _state_or_default(self.min_humidity, 30)
+            v_max = _state_or_default(self.max_humidity, 80)
             scores.append(self._calculate_range_score(val, float(v_min), float(v_max)))
 
             # Misting logic for tropicals/ferns
@@ -728,8 +885,8 @@ class PlantDevice(RestoreEntity):
         # Check Moisture
         val = get_val(self.sensor_moisture)
         if val is not None:
-            v_min = getattr(self.min_moisture, "state", 20)
-            v_max = getattr(self.max_moisture, "state", 60)
+            v_min = _state_or_default(self.min_moisture, 20)
+            v_max = _state_or_default(self.max_moisture, 60)
             scores.append(self._calculate_range_score(val, float(v_min), float(v_max)))
 
         if not scores:
@@ -812,91 +969,48 @@ class PlantDevice(RestoreEntity):
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
         self._async_update_registry()
+        self.async_on_remove(self._write_debouncer.async_cancel)
+
+        # The area can be changed on the entity, the device or the area itself
+        self.async_on_remove(
+            async_track_entity_registry_updated_event(
+                self._hass, self.entity_id, self._async_invalidate_area_cache
+            )
+        )
+        self.async_on_remove(
+            self._hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+            )
+        )
+        self.async_on_remove(
+            self._hass.bus.async_listen(
+                ar.EVENT_AREA_REGISTRY_UPDATED, self._async_invalidate_area_cache
+            )
+        )
+
         state = await self.async_get_last_state()
         if state:
-            self.last_watered = state.attributes.get(ATTR_LAST_WATERED)
-            self.snooze_until = state.attributes.get(ATTR_SNOOZE_UNTIL)
-            self.last_notified = state.attributes.get("last_notified")
+            self.last_watered = _parse_datetime(state.attributes.get(ATTR_LAST_WATERED))
+            self.snooze_until = _parse_datetime(state.attributes.get(ATTR_SNOOZE_UNTIL))
+            self.last_notified = _parse_datetime(state.attributes.get("last_notified"))
             self._water_factor = state.attributes.get("water_factor", 1.0)
             self._last_moisture = state.attributes.get("last_moisture")
 
-        if (
-            not self.scientific_name
-            or self.scientific_name == ""
-            or not self.origin
-            or self.origin == ""
-            or not self.category
-            or self.category == ""
-        ):
+        # None and "" both mean that the metadata is missing
+        if not (self.scientific_name and self.origin and self.category):
             _LOGGER.debug("Refreshing OPB metadata for %s", self.name)
-            plant_helper = PlantHelper(self._hass)
+            plant_helper = _async_get_plant_helper(self._hass)
             opb_plant = await plant_helper.openplantbook_get(self.species)
             if opb_plant:
                 self.scientific_name = opb_plant.get(
                     "scientific_name"
                 ) or opb_plant.get("species")
 
-                common_names = opb_plant.get("common_names") or opb_plant.get(
-                    "common_name"
+                self.common_name = opb_to_string(
+                    opb_first(opb_plant, OPB_COMMON_NAME_KEYS)
                 )
-                if isinstance(common_names, list):
-                    names = []
-                    for x in common_names:
-                        if isinstance(x, dict):
-                            names.append(
-                                str(
-                                    x.get(
-                                        "name",
-                                        x.get(
-                                            "value", list(x.values())[0] if x else ""
-                                        ),
-                                    )
-                                )
-                            )
-                        else:
-                            names.append(str(x))
-                    self.common_name = ", ".join([n for n in names if n])
-                else:
-                    self.common_name = common_names
-
-                category = (
-                    opb_plant.get("category")
-                    or opb_plant.get("plant_type")
-                    or opb_plant.get("type")
-                )
-                if isinstance(category, list):
-                    self.category = ", ".join([str(x) for x in category if x])
-                else:
-                    self.category = category
-
-                origins = (
-                    opb_plant.get("origin")
-                    or opb_plant.get("native_location")
-                    or opb_plant.get("native_distribution")
-                    or opb_plant.get("native_range")
-                    or opb_plant.get("distribution")
-                    or opb_plant.get("native_region")
-                )
-
-                if isinstance(origins, list):
-                    origin_list = []
-                    for x in origins:
-                        if isinstance(x, dict):
-                            origin_list.append(
-                                str(
-                                    x.get(
-                                        "name",
-                                        x.get(
-                                            "value", list(x.values())[0] if x else ""
-                                        ),
-                                    )
-                                )
-                            )
-                        else:
-                            origin_list.append(str(x))
-                    self.origin = ", ".join([o for o in origin_list if o])
-                else:
-                    self.origin = origins
+                self.category = opb_to_string(opb_first(opb_plant, OPB_CATEGORY_KEYS))
+                self.origin = opb_to_string(opb_first(opb_plant, OPB_ORIGIN_KEYS))
 
                 self.async_write_ha_state()
 
@@ -905,25 +1019,23 @@ class PlantDevice(RestoreEntity):
         """Return the device specific state attributes."""
         attributes = {
             ATTR_SPECIES: self.display_species,
-            f"{ATTR_SPECIES}_original": self.species,
+            ATTR_SPECIES_ORIGINAL: self.species,
             "scientific_name": self.scientific_name,
             "common_name": self.common_name,
             "category": self.category,
             "origin": self.origin,
             "pid": self.species,
-            f"{ATTR_MOISTURE}_status": self.moisture_status,
-            f"{ATTR_TEMPERATURE}_status": self.temperature_status,
-            f"{ATTR_CONDUCTIVITY}_status": self.conductivity_status,
-            f"{ATTR_ILLUMINANCE}_status": self.illuminance_status,
-            f"{ATTR_HUMIDITY}_status": self.humidity_status,
-            f"{ATTR_DLI}_status": self.dli_status,
+            ATTR_MOISTURE_STATUS: self.moisture_status,
+            ATTR_TEMPERATURE_STATUS: self.temperature_status,
+            ATTR_CONDUCTIVITY_STATUS: self.conductivity_status,
+            ATTR_ILLUMINANCE_STATUS: self.illuminance_status,
+            ATTR_HUMIDITY_STATUS: self.humidity_status,
+            ATTR_DLI_STATUS: self.dli_status,
             ATTR_NEXT_WATERING: self.next_watering,
-            "next_watering_days": int(str(self.next_watering).split(" ")[0])
-            if self.next_watering
-            else 0,
-            ATTR_LAST_WATERED: self.last_watered,
-            ATTR_SNOOZE_UNTIL: self.snooze_until,
-            "last_notified": self.last_notified,
+            "next_watering_days": self._next_watering_days,
+            ATTR_LAST_WATERED: _isoformat(self.last_watered),
+            ATTR_SNOOZE_UNTIL: _isoformat(self.snooze_until),
+            "last_notified": _isoformat(self.last_notified),
             "watering_explanation": self.watering_explanation,
             ATTR_WATER_FACTOR: round(self._water_factor, 2),
             ATTR_SMART_WATERING: self.smart_watering,
@@ -932,179 +1044,211 @@ class PlantDevice(RestoreEntity):
             "last_moisture": self._last_moisture,
         }
 
-        # Area lookup
-        entity_registry = er.async_get(self._hass)
-        entry = entity_registry.async_get(self.entity_id)
-        if entry:
-            area_id = entry.area_id
-            if not area_id and entry.device_id:
-                device_registry = dr.async_get(self._hass)
-                device = device_registry.async_get(entry.device_id)
-                if device:
-                    area_id = device.area_id
-
-            if area_id:
-                area_registry = ar.async_get(self._hass)
-                area = area_registry.async_get_area(area_id)
-                if area:
-                    attributes["area"] = area.name
+        area_name = self._get_area_name()
+        if area_name:
+            attributes["area"] = area_name
 
         return attributes
 
-    @property
-    def websocket_info(self) -> dict:
-        """Wesocket response"""
+    @callback
+    def _async_invalidate_area_cache(self, event: Event) -> None:
+        """Force a new area lookup after a registry update"""
+        self._area_cache_valid = False
 
-        # Fallback logic for temperature
-        temp_val = STATE_UNAVAILABLE
-        temp_icon = "mdi:thermometer"
-        temp_unit = "°C"
-        temp_sensor = None
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Force a new area lookup if our device was updated"""
+        if event.data.get("device_id") == self._device_id:
+            self._area_cache_valid = False
+
+    def _get_area_name(self) -> str | None:
+        """Return the name of the area of the plant, cached between registry updates"""
+        if self._area_cache_valid:
+            return self._cached_area_name
+
+        # Home Assistant keeps registry_entry up to date for us
+        entry = self.registry_entry
+        if not entry:
+            # Not registered yet, so try again on the next call
+            return None
 
-        if self.sensor_temperature:
-            temp_state = self._hass.states.get(self.sensor_temperature.entity_id)
-            temp_val = getattr(temp_state, "state", STATE_UNAVAILABLE)
-            temp_icon = self.sensor_temperature.icon
-            temp_unit = self.sensor_temperature.unit_of_measurement
-            temp_sensor = self.sensor_temperature.entity_id
+        area_name = None
+        area_id = entry.area_id
+        if not area_id and entry.device_id:
+            device = self._device_registry.async_get(entry.device_id)
+            if device:
+                area_id = device.area_id
 
-        if (
-            temp_val == STATE_UNKNOWN or temp_val == STATE_UNAVAILABLE
-        ) and self.room_temperature_sensor:
-            room_temp_state = self._hass.states.get(self.room_temperature_sensor)
-            if room_temp_state:
-                temp_val = room_temp_state.state
-                temp_icon = room_temp_state.attributes.get("icon", temp_icon)
-                temp_unit = room_temp_state.attributes.get(
-                    "unit_of_measurement", temp_unit
+        if area_id:
+            area = self._area_registry.async_get_area(area_id)
+            if area:
+                area_name = area.name
+
+        self._cached_area_name = area_name
+        self._area_cache_valid = True
+        return area_name
+
+    def _sensor_snapshot(
+        self,
+        sensor: Entity | None,
+        fallback_entity_id: str | None,
+        default_icon: str,
+        default_unit: str,
+        native_state: bool = False,
+    ) -> dict:
+        """Current value, icon, unit and entity_id of a meter for the websocket
+
+        With native_state, the current value is the meter entity's own state
+        rather than the string in the state machine.
+        If the meter has no usable value, the fallback sensor is used instead.
+        Each state is only fetched once from the state machine.
+        """
+        snapshot = {
+            ATTR_CURRENT: STATE_UNAVAILABLE,
+            ATTR_ICON: default_icon,
+            ATTR_UNIT_OF_MEASUREMENT: default_unit,
+            ATTR_SENSOR: None,
+        }
+        if sensor:
+            if native_state:
+                snapshot[ATTR_CURRENT] = sensor.state
+            else:
+                state = self._hass.states.get(sensor.entity_id)
+                snapshot[ATTR_CURRENT] = state.state if state else STATE_UNAVAILABLE
+            snapshot[ATTR_ICON] = sensor.icon
+            snapshot[ATTR_UNIT_OF_MEASUREMENT] = sensor.unit_of_measurement
+            snapshot[ATTR_SENSOR] = sensor.entity_id
+
+        if snapshot[ATTR_CURRENT] in UNAVAILABLE_STATES and fallback_entity_id:
+            state = self._hass.states.get(fallback_entity_id)
+            if state:
+                snapshot[ATTR_CURRENT] = state.state
+                snapshot[ATTR_ICON] = state.attributes.get(
+                    ATTR_ICON, snapshot[ATTR_ICON]
+                )
+                snapshot[ATTR_UNIT_OF_MEASUREMENT] = state.attributes.get(
+                    ATTR_UNIT_OF_MEASUREMENT, snapshot[ATTR_UNIT_OF_MEASUREMENT]
                 )
-                temp_sensor = self.room_temperature_sensor
+                snapshot[ATTR_SENSOR] = fallback_entity_id
 
-        # Fallback logic for humidity
-        hum_val = STATE_UNAVAILABLE
-        hum_icon = "mdi:water-percent"
-        hum_unit = "%"
-        hum_sensor = None
+        return snapshot
 
-        if self.sensor_humidity:
-            hum_state = self._hass.states.get(self.sensor_humidity.entity_id)
-            hum_val = getattr(hum_state, "state", STATE_UNAVAILABLE)
-            hum_icon = self.sensor_humidity.icon
-            hum_unit = self.sensor_humidity.unit_of_measurement
-            hum_sensor = self.sensor_humidity.entity_id
+    @property
+    def websocket_info(self) -> dict:
+        """Wesocket response"""
+        dli = self.dli
 
-        if (
-            hum_val == STATE_UNKNOWN or hum_val == STATE_UNAVAILABLE
-        ) and self.room_humidity_sensor:
-            room_hum_state = self._hass.states.get(self.room_humidity_sensor)
-            if room_hum_state:
-                hum_val = room_hum_state.state
-                hum_icon = room_hum_state.attributes.get("icon", hum_icon)
-                hum_unit = room_hum_state.attributes.get(
-                    "unit_of_measurement", hum_unit
-                )
-                hum_sensor = self.room_humidity_sensor
+        temperature = self._sensor_snapshot(
+            self.sensor_temperature,
+            self.room_temperature_sensor,
+            "mdi:thermometer",
+            "°C",
+        )
+        humidity = self._sensor_snapshot(
+            self.sensor_humidity,
+            self.room_humidity_sensor,
+            "mdi:water-percent",
+            "%",
+        )
+        illuminance = self._sensor_snapshot(
+            self.sensor_illuminance, None, "mdi:brightness-6", "lx", native_state=True
+        )
+        moisture = self._sensor_snapshot(
+            self.sensor_moisture, None, "mdi:water", "%", native_state=True
+        )
+        conductivity = self._sensor_snapshot(
+            self.sensor_conductivity,
+            None,
+            "mdi:spa-outline",
+            "μS/cm",
+            native_state=True,
+        )
 
         response = {
             ATTR_TEMPERATURE: {
-                ATTR_MAX: getattr(self.max_temperature, "state", 40)
-                if temp_sensor
-                else None,
-                ATTR_MIN: getattr(self.min_temperature, "state", 10)
-                if temp_sensor
-                else None,
-                ATTR_CURRENT: temp_val,
-                ATTR_ICON: temp_icon,
-                ATTR_UNIT_OF_MEASUREMENT: temp_unit,
-                ATTR_SENSOR: temp_sensor,
+                ATTR_MAX: (
+                    _state_or_default(self.max_temperature, 40)
+                    if temperature[ATTR_SENSOR]
+                    else None
+                ),
+                ATTR_MIN: (
+                    _state_or_default(self.min_temperature, 10)
+                    if temperature[ATTR_SENSOR]
+                    else None
+                ),
+                **temperature,
             },
             ATTR_ILLUMINANCE: {
-                ATTR_MAX: getattr(self.max_illuminance, "state", 100000)
-                if self.sensor_illuminance
-                else None,
-                ATTR_MIN: getattr(self.min_illuminance, "state", 0)
-                if self.sensor_illuminance
-                else None,
-                ATTR_CURRENT: getattr(
-                    self.sensor_illuminance, "state", STATE_UNAVAILABLE
-                )
-                if self.sensor_illuminance
-                else STATE_UNAVAILABLE,
-                ATTR_ICON: getattr(self.sensor_illuminance, "icon", "mdi:brightness-6"),
-                ATTR_UNIT_OF_MEASUREMENT: getattr(
-                    self.sensor_illuminance, "unit_of_measurement", "lx"
+                ATTR_MAX: (
+                    _state_or_default(self.max_illuminance, 100000)
+                    if illuminance[ATTR_SENSOR]
+                    else None
+                ),
+                ATTR_MIN: (
+                    _state_or_default(self.min_illuminance, 0)
+                    if illuminance[ATTR_SENSOR]
+                    else None
                 ),
-                ATTR_SENSOR: getattr(self.sensor_illuminance, "entity_id", None),
+                **illuminance,
             },
             ATTR_MOISTURE: {
-                ATTR_MAX: getattr(self.max_moisture, "state", 60)
-                if self.sensor_moisture
-                else None,
-                ATTR_MIN: getattr(self.min_moisture, "state", 20)
-                if self.sensor_moisture
-                else None,
-                ATTR_CURRENT: getattr(self.sensor_moisture, "state", STATE_UNAVAILABLE)
-                if self.sensor_moisture
-                else STATE_UNAVAILABLE,
-                ATTR_ICON: getattr(self.sensor_moisture, "icon", "mdi:water"),
-                ATTR_UNIT_OF_MEASUREMENT: getattr(
-                    self.sensor_moisture, "unit_of_measurement", "%"
+                ATTR_MAX: (
+                    _state_or_default(self.max_moisture, 60)
+                    if moisture[ATTR_SENSOR]
+                    else None
                 ),
-                ATTR_SENSOR: getattr(self.sensor_moisture, "entity_id", None),
+                ATTR_MIN: (
+                    _state_or_default(self.min_moisture, 20)
+                    if moisture[ATTR_SENSOR]
+                    else None
+                ),
+                **moisture,
             },
             ATTR_CONDUCTIVITY: {
-                ATTR_MAX: getattr(self.max_conductivity, "state", 3000)
-                if self.sensor_conductivity
-                else None,
-                ATTR_MIN: getattr(self.min_conductivity, "state", 500)
-                if self.sensor_conductivity
-                else None,
-                ATTR_CURRENT: getattr(
-                    self.sensor_conductivity, "state", STATE_UNAVAILABLE
-                )
-                if self.sensor_conductivity
-                else STATE_UNAVAILABLE,
-                ATTR_ICON: getattr(self.sensor_conductivity, "icon", "mdi:spa-outline"),
-                ATTR_UNIT_OF_MEASUREMENT: getattr(
-                    self.sensor_conductivity, "unit_of_measurement", "μS/cm"
+                ATTR_MAX: (
+                    _state_or_default(self.max_conductivity, 3000)
+                    if conductivity[ATTR_SENSOR]
+                    else None
                 ),
-                ATTR_SENSOR: getattr(self.sensor_conductivity, "entity_id", None),
+                ATTR_MIN: (
+                    _state_or_default(self.min_conductivity, 500)
+                    if conductivity[ATTR_SENSOR]
+                    else None
+                ),
+                **conductivity,
             },
             ATTR_HUMIDITY: {
-                ATTR_MAX: getattr(self.max_humidity, "state", 60)
-                if hum_sensor
-                else None,
-                ATTR_MIN: getattr(self.min_humidity, "state", 20)
-                if hum_sensor
-                else None,
-                ATTR_CURRENT: hum_val,
-                ATTR_ICON: hum_icon,
-                ATTR_UNIT_OF_MEASUREMENT: hum_unit,
-                ATTR_SENSOR: hum_sensor,
+                ATTR_MAX: (
+                    _state_or_default(self.max_humidity, 60)
+                    if humidity[ATTR_SENSOR]
+                    else None
+                ),
+                ATTR_MIN: (
+                    _state_or_default(self.min_humidity, 20)
+                    if humidity[ATTR_SENSOR]
+                    else None
+                ),
+                **humidity,
             },
             ATTR_DLI: {
-                ATTR_MAX: getattr(self.max_dli, "state", 30) if self.dli else None,
-                ATTR_MIN: getattr(self.min_dli, "state", 2) if self.dli else None,
+                ATTR_MAX: _state_or_default(self.max_dli, 30) if dli else None,
+                ATTR_MIN: _state_or_default(self.min_dli, 2) if dli else None,
                 ATTR_CURRENT: STATE_UNAVAILABLE,
-                ATTR_ICON: getattr(self.dli, "icon", "mdi:counter")
-                if self.dli
-                else "mdi:counter",
-                ATTR_UNIT_OF_MEASUREMENT: getattr(
-                    self.dli, "unit_of_measurement", "mol/d⋅m²"
-                )
-                if self.dli
-                else "mol/d⋅m²",
-                ATTR_SENSOR: getattr(self.dli, "entity_id", None),
+                ATTR_ICON: dli.icon if dli else "mdi:counter",
+                ATTR_UNIT_OF_MEASUREMENT: (
+                    dli.unit_of_measurement if dli else "mol/d⋅m²"
+                ),
+                ATTR_SENSOR: dli.entity_id if dli else None,
             },
             ATTR_NEXT_WATERING: self.next_watering,
-            ATTR_LAST_WATERED: self.last_watered,
-            ATTR_SNOOZE_UNTIL: self.snooze_until,
+            ATTR_LAST_WATERED: _isoformat(self.last_watered),
+            ATTR_SNOOZE_UNTIL: _isoformat(self.snooze_until),
             ATTR_ROOM_TEMPERATURE: self.room_temperature_sensor,
             ATTR_ROOM_HUMIDITY: self.room_humidity_sensor,
             ATTR_WEATHER_ENTITY: self.weather_entity,
             ATTR_OUTSIDE: self.outside,
             ATTR_WATERING: self.watering_days,
-            "area": None,
+            "area": self._get_area_name(),
             "scientific_name": self.scientific_name,
             "common_name": self.common_name,
             "category": self.category,
@@ -1121,13 +1265,10 @@ class PlantDevice(RestoreEntity):
         # Add factor to watering or existing response?
         # The existing 'response' object has ATTR_NEXT_WATERING etc.
         # We'll merge our expanded watering info into the response
-        try:
-            days_remaining = float(str(self.next_watering).split(" ")[0])
-        except (ValueError, TypeError, IndexError):
-            days_remaining = 0.0
+        days_remaining = float(self._next_watering_days)
 
         response["watering"] = {
-            "last_watered": self.last_watered,
+            "last_watered": _isoformat(self.last_watered),
             "next_watering": self.next_watering,
             "days_until": days_remaining,
             "needs_watering": days_remaining <= 0.0,
@@ -1136,72 +1277,34 @@ class PlantDevice(RestoreEntity):
             "smart_watering": self.smart_watering,
         }
 
-        if self.dli and self.dli.state and self.dli.state != STATE_UNKNOWN:
-            response[ATTR_DLI][ATTR_CURRENT] = float(self.dli.state)
-
-        # Area lookup
-        entity_registry = er.async_get(self._hass)
-        entry = entity_registry.async_get(self.entity_id)
-        if entry:
-            area_id = entry.area_id
-            if not area_id and entry.device_id:
-                device_registry = dr.async_get(self._hass)
-                device = device_registry.async_get(entry.device_id)
-                if device:
-                    area_id = device.area_id
-
-            if area_id:
-                area_registry = ar.async_get(self._hass)
-                area = area_registry.async_get_area(area_id)
-                if area:
-                    response["area"] = area.name
+        if dli and dli.state and dli.state not in UNAVAILABLE_STATES:
+            response[ATTR_DLI][ATTR_CURRENT] = float(dli.state)
 
         return response
 
     @property
-    def threshold_entities(self) -> list[Entity]:
-        """List all threshold entities"""
-        return [
-            self.max_conductivity,
-            self.max_dli,
-            self.max_humidity,
-            self.max_illuminance,
-            self.max_moisture,
-            self.max_temperature,
-            self.min_conductivity,
-            self.min_dli,
-            self.min_humidity,
-            self.min_illuminance,
-            self.min_moisture,
-            self.min_temperature,
-        ]
+    def threshold_entities(self) -> tuple[Entity, ...]:
+        """All threshold entities"""
+        return _THRESHOLD_ENTITIES(self)
 
     @property
-    def meter_entities(self) -> list[Entity]:
-        """List all meter (sensor) entities"""
-        return [
-            self.sensor_conductivity,
-            self.sensor_humidity,
-            self.sensor_illuminance,
-            self.sensor_moisture,
-            self.sensor_temperature,
-        ]
+    def meter_entities(self) -> tuple[Entity, ...]:
+        """All meter (sensor) entities"""
+        return _METER_ENTITIES(self)
 
     @property
-    def integral_entities(self) -> list(Entity):
-        """List all integral entities"""
-        return [
-            self.dli,
-            self.ppfd,
-            self.total_integral,
-        ]
+    def integral_entities(self) -> tuple[Entity, ...]:
+        """All integral entities"""
+        return _INTEGRAL_ENTITIES(self)
 
     def add_image(self, image_url: str | None) -> None:
         """Set new entity_picture"""
         self._attr_entity_picture = image_url
-        options = self._config.options.copy()
-        options[ATTR_ENTITY_PICTURE] = image_url
-        self._hass.config_entries.async_update_entry(self._config, options=options)
+        # Options are replaced as a whole, so the other keys have to be kept
+        self._hass.config_entries.async_update_entry(
+            self._config,
+            options={**self._config.options, ATTR_ENTITY_PICTURE: image_url},
+        )
 
     def add_species(self, species: Entity | None) -> None:
         """Set new species"""
@@ -1269,138 +1372,101 @@ class PlantDevice(RestoreEntity):
 
         new_state = STATE_OK
         known_state = False
-        temperature = None
-        humidity = None
 
-        if self.sensor_moisture is not None:
-            moisture = getattr(
-                self._hass.states.get(self.sensor_moisture.entity_id), "state", None
-            )
-            if (
-                moisture is not None
-                and moisture != STATE_UNKNOWN
-                and moisture != STATE_UNAVAILABLE
-            ):
+        # Fetch every state only once per update
+        states_get = self._hass.states.get
+        # The platform sets the final entity_ids after add_sensors, and users may
+        # rename the meters, so they are read from the meters on every update
+        moisture_entity_id = _entity_id(self.sensor_moisture)
+        conductivity_entity_id = _entity_id(self.sensor_conductivity)
+        illuminance_entity_id = _entity_id(self.sensor_illuminance)
+        moisture_state = None
+        current_moisture = None
+        # Moisture thresholds are shared by the status check and the watering estimate
+        min_moisture = _threshold_value(self.min_moisture)
+        max_moisture = _threshold_value(self.max_moisture)
+
+        if moisture_entity_id is not None:
+            moisture_state = states_get(moisture_entity_id)
+            moisture = moisture_state.state if moisture_state else None
+            if moisture not in _BAD_STATES:
                 known_state = True
-                if float(moisture) < float(self.min_moisture.state):
+                current_moisture = float(moisture)
+                if min_moisture is not None and current_moisture < min_moisture:
                     self.moisture_status = STATE_LOW
                     if self.moisture_trigger:
                         new_state = STATE_PROBLEM
-                elif float(moisture) > float(self.max_moisture.state):
+                elif max_moisture is not None and current_moisture > max_moisture:
                     self.moisture_status = STATE_HIGH
                     if self.moisture_trigger:
                         new_state = STATE_PROBLEM
                 else:
                     self.moisture_status = STATE_OK
 
-        if self.sensor_conductivity is not None:
-            conductivity = getattr(
-                self._hass.states.get(self.sensor_conductivity.entity_id), "state", None
-            )
-            if (
-                conductivity is not None
-                and conductivity != STATE_UNKNOWN
-                and conductivity != STATE_UNAVAILABLE
-            ):
+        if conductivity_entity_id is not None:
+            conductivity_state = states_get(conductivity_entity_id)
+            conductivity = conductivity_state.state if conductivity_state else None
+            if conductivity not in _BAD_STATES:
                 known_state = True
-                if float(conductivity) < float(self.min_conductivity.state):
+                conductivity = float(conductivity)
+                if conductivity < float(self.min_conductivity.state):
                     self.conductivity_status = STATE_LOW
                     if self.conductivity_trigger:
                         new_state = STATE_PROBLEM
-                elif float(conductivity) > float(self.max_conductivity.state):
+                elif conductivity > float(self.max_conductivity.state):
                     self.conductivity_status = STATE_HIGH
                     if self.conductivity_trigger:
                         new_state = STATE_PROBLEM
                 else:
                     self.conductivity_status = STATE_OK
 
-        if self.sensor_temperature is not None or self.room_temperature_sensor:
-            temperature_state = None
-            if self.sensor_temperature:
-                temperature_state = self._hass.states.get(
-                    self.sensor_temperature.entity_id
-                )
-            temperature = getattr(temperature_state, "state", None)
-
-            if (
-                temperature is None
-                or temperature == STATE_UNKNOWN
-                or temperature == STATE_UNAVAILABLE
-            ):
-                if self.room_temperature_sensor:
-                    temperature_state = self._hass.states.get(
-                        self.room_temperature_sensor
-                    )
-                    temperature = getattr(temperature_state, "state", None)
-
-            if (
-                temperature is not None
-                and temperature != STATE_UNKNOWN
-                and temperature != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if self.min_temperature and float(temperature) < float(
-                    self.min_temperature.state
-                ):
-                    self.temperature_status = STATE_LOW
-                    if self.temperature_trigger:
-                        new_state = STATE_PROBLEM
-                elif self.max_temperature and float(temperature) > float(
-                    self.max_temperature.state
-                ):
-                    self.temperature_status = STATE_HIGH
-                    if self.temperature_trigger:
-                        new_state = STATE_PROBLEM
-                else:
-                    self.temperature_status = STATE_OK
-
-        if self.sensor_humidity is not None or self.room_humidity_sensor:
-            humidity_state = None
-            if self.sensor_humidity:
-                humidity_state = self._hass.states.get(self.sensor_humidity.entity_id)
-            humidity = getattr(humidity_state, "state", None)
-
-            if (
-                humidity is None
-                or humidity == STATE_UNKNOWN
-                or humidity == STATE_UNAVAILABLE
+        # The room sensor is only used when the plant sensor has no usable value
+        temperature = _usable_state(
+            states_get,
+            _entity_id(self.sensor_temperature),
+            self.room_temperature_sensor,
+        )
+        if temperature is not None:
+            known_state = True
+            temperature = float(temperature)
+            if self.min_temperature and temperature < float(self.min_temperature.state):
+                self.temperature_status = STATE_LOW
+                if self.temperature_trigger:
+                    new_state = STATE_PROBLEM
+            elif self.max_temperature and temperature > float(
+                self.max_temperature.state
             ):
-                if self.room_humidity_sensor:
-                    humidity_state = self._hass.states.get(self.room_humidity_sensor)
-                    humidity = getattr(humidity_state, "state", None)
+                self.temperature_status = STATE_HIGH
+                if self.temperature_trigger:
+                    new_state = STATE_PROBLEM
+            else:
+                self.temperature_status = STATE_OK
 
-            if (
-                humidity is not None
-                and humidity != STATE_UNKNOWN
-                and humidity != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if self.min_humidity and float(humidity) < float(
-                    self.min_humidity.state
-                ):
-                    self.humidity_status = STATE_LOW
-                    if self.humidity_trigger:
-                        new_state = STATE_PROBLEM
-                elif self.max_humidity and float(humidity) > float(
-                    self.max_humidity.state
-                ):
-                    self.humidity_status = STATE_HIGH
-                    if self.humidity_trigger:
-                        new_state = STATE_PROBLEM
-                else:
-                    self.humidity_status = STATE_OK
+        humidity = _usable_state(
+            states_get,
+            _entity_id(self.sensor_humidity),
+            self.room_humidity_sensor,
+        )
+        if humidity is not None:
+            known_state = True
+            humidity = float(humidity)
+            if self.min_humidity and humidity < float(self.min_humidity.state):
+                self.humidity_status = STATE_LOW
+                if self.humidity_trigger:
+                    new_state = STATE_PROBLEM
+            elif self.max_humidity and humidity > float(self.max_humidity.state):
+                self.humidity_status = STATE_HIGH
+                if self.humidity_trigger:
+                    new_state = STATE_PROBLEM
+            else:
+                self.humidity_status = STATE_OK
 
         # Check the instant values for illuminance against "max"
         # Ignoring "min" value for illuminance as it would probably trigger every night
-        if self.sensor_illuminance is not None:
-            illuminance = getattr(
-                self._hass.states.get(self.sensor_illuminance.entity_id), "state", None
-            )
-            if (
-                illuminance is not None
-                and illuminance != STATE_UNKNOWN
-                and illuminance != STATE_UNAVAILABLE
-            ):
+        if illuminance_entity_id is not None:
+            illuminance_state = states_get(illuminance_entity_id)
+            illuminance = illuminance_state.state if illuminance_state else None
+            if illuminance not in _BAD_STATES:
                 known_state = True
                 if float(illuminance) > float(self.max_illuminance.state):
                     self.illuminance_status = STATE_HIGH
@@ -1413,27 +1479,47 @@ class PlantDevice(RestoreEntity):
         # Check DLI from the previous day against max/min DLI
         if (
             self.dli is not None
-            and self.dli.native_value != STATE_UNKNOWN
-            and self.dli.native_value != STATE_UNAVAILABLE
+            and self.dli.native_value not in UNAVAILABLE_STATES
             and self.dli.state is not None
         ):
             known_state = True
-            if float(self.dli.extra_state_attributes["last_period"]) > 0 and float(
-                self.dli.extra_state_attributes["last_period"]
-            ) < float(self.min_dli.state):
+            last_period = float(self.dli.extra_state_attributes["last_period"])
+            if last_period > 0 and last_period < float(self.min_dli.state):
                 self.dli_status = STATE_LOW
                 if self.dli_trigger:
                     new_state = STATE_PROBLEM
-            elif float(self.dli.extra_state_attributes["last_period"]) > 0 and float(
-                self.dli.extra_state_attributes["last_period"]
-            ) > float(self.max_dli.state):
+            elif last_period > 0 and last_period > float(self.max_dli.state):
                 self.dli_status = STATE_HIGH
                 if self.dli_trigger:
                     new_state = STATE_PROBLEM
             else:
                 self.dli_status = STATE_OK
 
-        # Calculate Next Watering
+        self._watering_inputs = (
+            temperature,
+            humidity,
+            current_moisture,
+            min_moisture,
+            max_moisture,
+        )
+        self._sensor_problem = new_state == STATE_PROBLEM
+        self._known_state = known_state
+        # One timestamp for the whole update
+        now = datetime.now()
+        self._recalculate_next_watering(now)
+        self._check_and_notify(now)
+        if self._device_id is None:
+            self._hass.add_job(self._async_update_registry)
+
+    def _recalculate_next_watering(self, now: datetime) -> None:
+        """Calculate the next watering from the readings of the last update"""
+        (
+            temperature,
+            humidity,
+            current_moisture,
+            min_moisture,
+            max_moisture,
+        ) = self._watering_inputs
         days = 0
         moisture_calculated = False
         explanation_lines = []
@@ -1447,34 +1533,20 @@ class PlantDevice(RestoreEntity):
         # Plants with high min_moisture need water more frequently than the base config
         if self.smart_watering and self.sensor_moisture:
             try:
-                # Get fresh state for calculation
-                moisture_state = self._hass.states.get(self.sensor_moisture.entity_id)
-
                 # Logic Fix: Even if the CURRENT moisture is unavailable, we should still
                 # be able to calculate the BASE frequency adjustment based on config (min/max).
                 # The BASE adjustment depends on the PLANT SPECIES traits (min/max), not the current wetness.
 
                 # We proceed if min/max are available, regardless of current moisture reading.
-                try:
-                    min_m = float(self.min_moisture.state)
-                except AttributeError:
-                    min_m = float(self.min_moisture)
-
-                try:
-                    max_m = float(self.max_moisture.state)
-                except AttributeError:
-                    max_m = float(self.max_moisture)
-
-                # Check for valid thresholds
-                if min_m is not None and max_m is not None:
+                if min_moisture is not None and max_moisture is not None:
                     # Standard range logic:
                     # If plant needs high moisture (e.g. min 60%), it has a smaller usable range (max-min)
                     # So for the same daily loss, it needs to be watered more often.
                     # We adjust the base days to reflect this "effective" cycle length.
 
                     standard_min = 15.0  # Typical plant minimum
-                    current_range = max_m - min_m
-                    standard_range = max_m - standard_min
+                    current_range = max_moisture - min_moisture
+                    standard_range = max_moisture - standard_min
 
                     # Logic correction:
                     # Base days (e.g. 7 days) usually represents the time to go from MAX to Min for a STANDARD plant.
@@ -1500,7 +1572,10 @@ class PlantDevice(RestoreEntity):
                         explanation_lines.append(
                             f"Ajustement humidité : {original_base:.1f}j -> {base_days:.1f}j (Plage {current_range:.0f}%)"
                         )
-            except (ValueError, TypeError, AttributeError) as e:
+                else:
+                    # Report a missing or non-numeric threshold like a conversion error
+                    explanation_lines.append("Err SMT: moisture thresholds unavailable")
+            except (ValueError, TypeError, ZeroDivisionError) as e:
                 explanation_lines.append(f"Err SMT: {e}")
                 pass
 
@@ -1533,29 +1608,20 @@ class PlantDevice(RestoreEntity):
             )
 
         adj = 1.0
-        # Use temperature if available (set above in the health check)
-        try:
-            temp = float(temperature)
-            if temp != 22:
-                temp_adj = (temp - 22) * 0.05
-                adj *= 1 + temp_adj
-                explanation_lines.append(
-                    f"Température ({temp}°C) : {'+' if temp_adj > 0 else ''}{int(temp_adj * 100)}% d'évaporation"
-                )
-        except (ValueError, TypeError, NameError):
-            temp = 22
+        # Temperature and humidity were already converted to float (or None) in update()
+        if temperature is not None and temperature != 22:
+            temp_adj = (temperature - 22) * 0.05
+            adj *= 1 + temp_adj
+            explanation_lines.append(
+                f"Température ({temperature}°C) : {'+' if temp_adj > 0 else ''}{int(temp_adj * 100)}% d'évaporation"
+            )
 
-        # Use humidity if available
-        try:
-            hum = float(humidity)
-            if hum != 50:
-                hum_adj = (hum - 50) * 0.004
-                adj *= 1 - hum_adj
-                explanation_lines.append(
-                    f"Humidité ({hum}%) : {'-' if hum_adj > 0 else '+'}{abs(int(hum_adj * 100))}% d'évaporation"
-                )
-        except (ValueError, TypeError, NameError):
-            hum = 50
+        if humidity is not None and humidity != 50:
+            hum_adj = (humidity - 50) * 0.004
+            adj *= 1 - hum_adj
+            explanation_lines.append(
+                f"Humidité ({humidity}%) : {'-' if hum_adj > 0 else '+'}{abs(int(hum_adj * 100))}% d'évaporation"
+            )
 
         # Weather info (only for outdoor plants)
         if self.outside and self.weather_entity:
@@ -1563,41 +1629,39 @@ class PlantDevice(RestoreEntity):
             if weather_state:
                 # Check current condition for immediate watering reset
                 current_condition = weather_state.state
-                if current_condition in ("rainy", "pouring", "hail"):
+                if current_condition in _RAINING_CONDITIONS:
                     explanation_lines.append("Il pleut actuellement : arrosage naturel")
                     # If no valid moisture sensor, we reset the timer
                     if not moisture_calculated:
-                        self.last_watered = datetime.now().isoformat()
+                        self.last_watered = now
                         # Recalculate time since watering for the logic below
                         time_since_watering = timedelta(0)
                         days_since_watering = 0
 
-                forecast = weather_state.attributes.get("forecast", [])
-                if forecast:
+                # The forecast only needs a new scan when the weather entity changed
+                last_updated, rainy_forecast = self._weather_cache
+                if weather_state.last_updated != last_updated:
+                    forecast = weather_state.attributes.get("forecast") or []
                     rainy_forecast = any(
-                        f.get("condition") in ("rainy", "pouring", "hail", "snowy")
+                        f.get("condition") in _RAINY_CONDITIONS
                         or f.get("precipitation", 0) > 2
                         for f in forecast[:2]
                     )
-                    if rainy_forecast:
-                        adj *= 0.5
-                        explanation_lines.append(
-                            "Pluie prévue (extérieur) : -50% d'évaporation"
-                        )
+                    self._weather_cache = (weather_state.last_updated, rainy_forecast)
+                if rainy_forecast:
+                    adj *= 0.5
+                    explanation_lines.append(
+                        "Pluie prévue (extérieur) : -50% d'évaporation"
+                    )
 
         adj = max(0.1, adj)
 
         if self.sensor_moisture is not None:
-            moisture_state = self._hass.states.get(self.sensor_moisture.entity_id)
             if (
-                moisture_state
-                and moisture_state.state != STATE_UNKNOWN
-                and moisture_state.state != STATE_UNAVAILABLE
+                current_moisture is not None
+                and min_moisture is not None
+                and max_moisture is not None
             ):
-                current_moisture = float(moisture_state.state)
-                min_moisture = float(self.min_moisture.state)
-                max_moisture = float(self.max_moisture.state)
-
                 # Default loss rate: assumes self.watering_days to go from max to min
                 # If smart watering is enabled, we assume the base cycle applies to a standard range (max -> 15%)
                 # allowing the user's min_moisture setting to affect frequency
@@ -1619,36 +1683,34 @@ class PlantDevice(RestoreEntity):
 
         # If recently watered, or if no sensor, use timer-based logic
         if self.last_watered:
-            try:
-                last_watered_dt = datetime.fromisoformat(self.last_watered)
-                time_since_watering = datetime.now() - last_watered_dt
-                days_since_watering = time_since_watering.total_seconds() / 86400
-
-                if time_since_watering < timedelta(hours=12):
-                    # Force a refresh to full period if just watered (sensors might be slow)
-                    # Use the adjusted cycle length for calculations
-                    base_adjusted = int(base_days / adj)
-                    if days < base_adjusted:
-                        days = base_adjusted
-                        explanation_lines.append(
-                            "Arrosage récent détecté : délai réinitialisé"
-                        )
-                    self.moisture_status = STATE_OK
-                elif not moisture_calculated:
-                    # No valid sensor data? Use timer-based fallback
-                    total_cycle = base_days / adj
-                    days = int(total_cycle - days_since_watering)
+            time_since_watering = now - self.last_watered
+            days_since_watering = time_since_watering.total_seconds() / 86400
+
+            if time_since_watering < timedelta(hours=12):
+                # Force a refresh to full period if just watered (sensors might be slow)
+                # Use the adjusted cycle length for calculations
+                base_adjusted = int(base_days / adj)
+                if days < base_adjusted:
+                    days = base_adjusted
                     explanation_lines.append(
-                        f"Calcul basé sur le temps ({days_since_watering:.1f}j écoulés sur {total_cycle:.1f}j prévus)"
+                        "Arrosage récent détecté : délai réinitialisé"
                     )
-            except (ValueError, TypeError):
-                pass
+                self.moisture_status = STATE_OK
+            elif not moisture_calculated:
+                # No valid sensor data? Use timer-based fallback
+                total_cycle = base_days / adj
+                days = int(total_cycle - days_since_watering)
+                explanation_lines.append(
+                    f"Calcul basé sur le temps ({days_since_watering:.1f}j écoulés sur {total_cycle:.1f}j prévus)"
+                )
         elif not moisture_calculated:
             # no moisture and no last_watered
             days = int(base_days / adj)
             explanation_lines.append("Aucun historique d'arrosage : délai théorique")
 
         self.next_watering = f"{days} j"
+        self._next_watering_days = days
+        new_state = STATE_PROBLEM if self._sensor_problem else STATE_OK
         if days <= 0:
             self.moisture_status = STATE_LOW
             if self.moisture_trigger:
@@ -1658,12 +1720,10 @@ class PlantDevice(RestoreEntity):
 
         self._watering_explanation = "\n".join(explanation_lines)
 
-        if not known_state:
+        if not self._known_state:
             new_state = STATE_UNKNOWN
 
         self._attr_state = new_state
-        self._check_and_notify()
-        self._hass.add_job(self._async_update_registry)
 
     @property
     def data_source(self) -> str | None:
@@ -1672,23 +1732,29 @@ class PlantDevice(RestoreEntity):
 
     @callback
     def _async_update_registry(self) -> None:
-        """Update registry with correct data"""
+        """Add the plant device to the registry, once"""
         # Is there a better way to add an entity to the device registry?
+        if self._device_id is not None:
+            return
 
-        device_registry = dr.async_get(self._hass)
-        device_registry.async_get_or_create(
+        device = self._device_registry.async_get_or_create(
             config_entry_id=self._config.entry_id,
             identifiers={(DOMAIN, self.unique_id)},
             name=self.name,
             model=self.display_species,
             manufacturer=self.data_source,
         )
+        self._device_id = device.id
+
+    @callback
+    def update_registry(self) -> None:
+        """Update the device registry after the name or species changed"""
         if self._device_id is None:
-            device = device_registry.async_get_device(
-                identifiers={(DOMAIN, self.unique_id)}
-            )
-            if device:
-                self._device_id = device.id
+            self._async_update_registry()
+            return
+        self._device_registry.async_update_device(
+            self._device_id, name=self.name, model=self.display_species
+        )
 
     @callback
     def async_watered(self) -> None:
@@ -1706,49 +1772,41 @@ class PlantDevice(RestoreEntity):
 
         # Adaptive learning: adjust _water_factor based on when the user actually watered
         if self.last_watered:
-            try:
-                last_dt = datetime.fromisoformat(self.last_watered)
-                # How long since last watering in days
-                days_since_watering = (now - last_dt).total_seconds() / 86400
-
-                # What was our prediction?
-                # self.next_watering is "X j"
-                try:
-                    remaining_days = int(str(self.next_watering).split(" ")[0])
-                    # Total predicted interval for this cycle
-                    predicted_total_days = days_since_watering + remaining_days
-
-                    if predicted_total_days > 0.5:
-                        ratio = days_since_watering / predicted_total_days
-                        # ratio > 1: watered later than predicted -> increase factor
-                        # ratio < 1: watered earlier than predicted -> decrease factor
-                        ratio = max(0.5, min(2.0, ratio))
-                        # Increase weight of adaptation from 0.1 to 0.3 to make it more responsive
-                        new_factor = self._water_factor * (1.0 + (ratio - 1.0) * 0.3)
-                        self._water_factor = max(0.1, min(10.0, new_factor))
-                        _LOGGER.info(
-                            "Plant %s adaptive learning (WATERED): ratio=%.2f, new factor=%.4f (base: %sj)",
-                            self.name,
-                            ratio,
-                            self._water_factor,
-                            self.watering_days,
-                        )
-                except (ValueError, IndexError):
-                    pass
-            except ValueError:
-                pass
+            # How long since last watering in days
+            days_since_watering = (now - self.last_watered).total_seconds() / 86400
+
+            # What was our prediction?
+            # Total predicted interval for this cycle
+            predicted_total_days = days_since_watering + self._next_watering_days
+
+            if predicted_total_days > 0.5:
+                ratio = days_since_watering / predicted_total_days
+                # ratio > 1: watered later than predicted -> increase factor
+                # ratio < 1: watered earlier than predicted -> decrease factor
+                ratio = max(0.5, min(2.0, ratio))
+                # Increase weight of adaptation from 0.1 to 0.3 to make it more responsive
+                new_factor = self._water_factor * (1.0 + (ratio - 1.0) * 0.3)
+                self._water_factor = max(0.1, min(10.0, new_factor))
+                _LOGGER.info(
+                    "Plant %s adaptive learning (WATERED): ratio=%.2f, new factor=%.4f (base: %sj)",
+                    self.name,
+                    ratio,
+                    self._water_factor,
+                    self.watering_days,
+                )
 
-        self.last_watered = now.isoformat()
+        self.last_watered = now
         self.snooze_until = None
-        self.update()
-        self.async_write_ha_state()
+        self._recalculate_next_watering(now)
+        self._write_debouncer.async_schedule_call()
 
     @callback
     def async_snooze(self) -> None:
         """Snooze the watering notification."""
-        self.snooze_until = (datetime.now() + timedelta(hours=1)).isoformat()
-        self.update()
-        self.async_write_ha_state()
+        now = datetime.now()
+        self.snooze_until = now + timedelta(hours=1)
+        self._recalculate_next_watering(now)
+        self._write_debouncer.async_schedule_call()
 
     @callback
     def async_skip_watering(self) -> None:
@@ -1774,52 +1832,48 @@ class PlantDevice(RestoreEntity):
             self.watering_days,
         )
         # Snooze for 24h as we "skipped" it
-        self.snooze_until = (datetime.now() + timedelta(days=1)).isoformat()
-        self.update()
-        self.async_write_ha_state()
+        now = datetime.now()
+        self.snooze_until = now + timedelta(days=1)
+        self._recalculate_next_watering(now)
+        self._write_debouncer.async_schedule_call()
 
-    def _check_and_notify(self) -> None:
+    def _check_and_notify(self, now: datetime) -> None:
         """Check if we should send a notification."""
-        if self.moisture_status != STATE_LOW or not self.moisture_trigger:
+        if (
+            self._notification_pending
+            or self.moisture_status != STATE_LOW
+            or not self.moisture_trigger
+        ):
             return
 
-        now = datetime.now()
-
         # Snooze handling takes priority
         # If user snoozed, we allow notifications outside of the 9:00 AM window
-        is_snoozed = False
         if self.snooze_until:
-            try:
-                snooze_dt = datetime.fromisoformat(self.snooze_until)
-                if now < snooze_dt:
-                    return
-                # If we are past the snooze time, we should notify regardless of the morning window
-                is_snoozed = True
-            except ValueError:
-                pass
-
-        # Morning notification logic (around 9:00 AM)
-        # Only check the window if we are NOT returning from a snooze
-        if not is_snoozed and (now.hour < 9 or now.hour >= 10):
-            return
+            if now < self.snooze_until:
+                return
+            # If we are past the snooze time, we should notify regardless of the morning window
+        else:
+            # Morning notification logic (around 9:00 AM)
+            if now.hour != 9:
+                return
 
-        if self.last_notified:
-            try:
-                last_dt = datetime.fromisoformat(self.last_notified)
-                # If we already notified today (after 8:00 AM), don't notify again UNLESS we just woke up from a snooze
-                if (
-                    not is_snoozed
-                    and last_dt.date() == now.date()
-                    and last_dt.hour >= 8
-                ):
-                    return
-            except ValueError:
-                pass
+            # If we already notified today (after 8:00 AM), don't notify again
+            last_dt = self.last_notified
+            if last_dt and last_dt.date() == now.date() and last_dt.hour >= 8:
+                return
 
+        self._notification_pending = True
         self._hass.add_job(self._async_send_notification)
 
     async def _async_send_notification(self) -> None:
         """Send a notification."""
+        try:
+            await self._async_notify()
+        finally:
+            self._notification_pending = False
+
+    async def _async_notify(self) -> None:
+        """Call the configured notify service"""
         notify_service = self.notification_service or "all_phones"
         if notify_service.startswith("notify."):
             notify_service = notify_service[7:]
@@ -1852,6 +1906,6 @@ class PlantDevice(RestoreEntity):
             },
         }
         await self._hass.services.async_call("notify", notify_service, service_data)
-        self.last_notified = datetime.now().isoformat()
+        self.last_notified = datetime.now()
         self.snooze_until = None
         self.async_write_ha_state()  # Ensure state is saved
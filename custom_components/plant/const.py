@@ -91,6 +91,11 @@ DATA_SOURCE_PLANTBOOK = "OpenPlantbook"
 DATA_SOURCE_MANUAL = "Manual"
 DATA_SOURCE_DEFAULT = "Default values"
 DATA_UPDATED = "plant_data_updated"
+DATA_INDEX = "_index"
+DATA_HELPER = "_helper"
+DATA_NOTIFICATION_LISTENER = "_notification_listener"
+DATA_PLANT_BY_UNIQUE_ID = "plant_by_unique_id"
+DATA_SENSOR_BY_UNIQUE_ID = "sensor_by_unique_id"
 
 
 UNIT_PPFD = "mol/s⋅m²"
@@ -144,6 +149,17 @@ OPB_SEARCH = "search"
 OPB_SEARCH_RESULT = "search_result"
 OPB_PID = "pid"
 OPB_DISPLAY_PID = "display_pid"
+# OPB fields to try, in order, for the plant metadata
+OPB_COMMON_NAME_KEYS = ("common_names", "common_name")
+OPB_CATEGORY_KEYS = ("category", "plant_type", "type")
+OPB_ORIGIN_KEYS = (
+    "origin",
+    "native_location",
+    "native_distribution",
+    "native_range",
+    "distribution",
+    "native_region",
+)
 
 # PPFD to DLI: /1000000 * 3600 to get from microseconds to hours
 PPFD_DLI_FACTOR = 0.0036
@@ -77,8 +77,11 @@ from .const import (
     FLOW_SENSOR_ROOM_TEMPERATURE,
     FLOW_SENSOR_TEMPERATURE,
     FLOW_WEATHER_ENTITY,
+    OPB_CATEGORY_KEYS,
+    OPB_COMMON_NAME_KEYS,
     OPB_DISPLAY_PID,
     OPB_GET,
+    OPB_ORIGIN_KEYS,
     OPB_SEARCH,
     PPFD_DLI_FACTOR,
     REQUEST_TIMEOUT,
@@ -87,6 +90,35 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def opb_first(opb_plant: dict, keys: tuple[str, ...]) -> Any:
+    """Return the first non-empty value of keys from an OPB result"""
+    return next((opb_plant[key] for key in keys if opb_plant.get(key)), None)
+
+
+def opb_to_string(value: Any) -> Any:
+    """Join an OPB list of strings or dicts to a comma separated string
+
+    Dicts are represented by their "name", "value" or first value.
+    Anything that is not a list is returned unchanged.
+    """
+    if not isinstance(value, list):
+        return value
+    names = (_opb_item_name(item) for item in value)
+    return ", ".join(name for name in names if name)
+
+
+def _opb_item_name(item: Any) -> str:
+    """String representation of a single item in an OPB list"""
+    if isinstance(item, dict):
+        item = (
+            item.get("name")
+            or item.get("value")
+            or next(iter(item.values()), None)
+            or ""
+        )
+    return str(item)
+
+
 class PlantHelper:
     """Helper functions for the plant integration"""
 
@@ -326,11 +358,7 @@ class PlantHelper:
             )
 
             # Determine category first to assist with watering fallback
-            category_raw = (
-                opb_plant.get("category")
-                or opb_plant.get("plant_type")
-                or opb_plant.get("type")
-            )
+            category_raw = opb_first(opb_plant, OPB_CATEGORY_KEYS)
 
             watering = opb_plant.get(CONF_PLANTBOOK_MAPPING[CONF_WATERING])
             if isinstance(watering, str):
@@ -363,57 +391,9 @@ class PlantHelper:
             scientific_name = opb_plant.get("scientific_name") or opb_plant.get(
                 "species"
             )
-            common_names = opb_plant.get("common_names") or opb_plant.get("common_name")
-
-            if isinstance(common_names, list):
-                names = []
-                for x in common_names:
-                    if isinstance(x, dict):
-                        names.append(
-                            str(
-                                x.get(
-                                    "name",
-                                    x.get("value", list(x.values())[0] if x else ""),
-                                )
-                            )
-                        )
-                    else:
-                        names.append(str(x))
-                common_name = ", ".join([n for n in names if n])
-            else:
-                common_name = common_names
-
-            if isinstance(category_raw, list):
-                category = ", ".join([str(x) for x in category_raw if x])
-            else:
-                category = category_raw
-
-            origins = (
-                opb_plant.get("origin")
-                or opb_plant.get("native_location")
-                or opb_plant.get("native_distribution")
-                or opb_plant.get("native_range")
-                or opb_plant.get("distribution")
-                or opb_plant.get("native_region")
-            )
-
-            if isinstance(origins, list):
-                origin_list = []
-                for x in origins:
-                    if isinstance(x, dict):
-                        origin_list.append(
-                            str(
-                                x.get(
-                                    "name",
-                                    x.get("value", list(x.values())[0] if x else ""),
-                                )
-                            )
-                        )
-                    else:
-                        origin_list.append(str(x))
-                origin = ", ".join([o for o in origin_list if o])
-            else:
-                origin = origins
+            common_name = opb_to_string(opb_first(opb_plant, OPB_COMMON_NAME_KEYS))
+            category = opb_to_string(category_raw)
+            origin = opb_to_string(opb_first(opb_plant, OPB_ORIGIN_KEYS))
             if (
                 entity_picture is None
                 or entity_picture == ""
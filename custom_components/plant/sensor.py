@@ -23,13 +23,12 @@ from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     LIGHT_LUX,
     PERCENTAGE,
-    STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfConductivity,
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import (
     Entity,
@@ -39,7 +38,7 @@ from homeassistant.helpers.entity import (
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
-from . import SETUP_DUMMY_SENSORS
+from . import SETUP_DUMMY_SENSORS, UNAVAILABLE_STATES
 from .const import (
     ATTR_CONDUCTIVITY,
     ATTR_DLI,
@@ -77,6 +76,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# From lx to mol/m²/s
+_PPFD_SCALE = DEFAULT_LUX_TO_PPFD / 1000000
+
+# Random values for the dummy sensors
+_randrange = random.Random().randrange
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -144,6 +149,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class PlantCurrentStatus(RestoreSensor):
     """Parent class for the meter classes below"""
 
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -152,17 +159,21 @@ class PlantCurrentStatus(RestoreSensor):
         self._config = config
         self._default_state = None
         self._plant = plantdevice
-        self._tracker = []
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, plantdevice.unique_id)},
+        }
+        self._tracker: set[str] = set()
+        self._unsub_tracker: CALLBACK_TYPE | None = None
+        self._added = False
         self._follow_external = True
+        # No external sensor is always stored as None, never as ""
+        self._external_sensor = self._external_sensor or None
+        self._update_external_attributes()
         # self._conf_check_days = self._plant.check_days
         self.entity_id = async_generate_entity_id(
             f"{DOMAIN}.{{}}", self.name, current_ids={}
         )
-        if (
-            not self._attr_native_value
-            or self._attr_native_value == STATE_UNKNOWN
-            or self._attr_native_value == STATE_UNAVAILABLE
-        ):
+        if not self._attr_native_value or self._attr_native_value in UNAVAILABLE_STATES:
             _LOGGER.debug(
                 "Unknown native value for %s, setting to default: %s",
                 self.entity_id,
@@ -170,27 +181,6 @@ class PlantCurrentStatus(RestoreSensor):
             )
             self._attr_native_value = self._default_state
 
-    @property
-    def state_class(self):
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def device_info(self) -> dict:
-        """Device info for devices"""
-        return {
-            "identifiers": {(DOMAIN, self._plant.unique_id)},
-        }
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        if self._external_sensor:
-            attributes = {
-                "external_sensor": self.external_sensor,
-                # "history_max": self._history.max,
-                # "history_min": self._history.min,
-            }
-            return attributes
-
     @property
     def external_sensor(self) -> str:
         """The external sensor we are tracking"""
@@ -200,84 +190,127 @@ class PlantCurrentStatus(RestoreSensor):
         """Modify the external sensor"""
         _LOGGER.info("Setting %s external sensor to %s", self.entity_id, new_sensor)
         # pylint: disable=attribute-defined-outside-init
-        self._external_sensor = new_sensor
-        self.async_track_entity(self.entity_id)
-        self.async_track_entity(self.external_sensor)
+        self._external_sensor = new_sensor or None
+        self._update_external_attributes()
+        self._async_track_entities()
 
         self.async_write_ha_state()
 
-    def async_track_entity(self, entity_id: str) -> None:
-        """Track state_changed of certain entities"""
-        if entity_id and entity_id not in self._tracker:
-            async_track_state_change_event(
-                self._hass,
-                list([entity_id]),
-                self._state_changed_event,
-            )
-            self._tracker.append(entity_id)
+    def _update_external_attributes(self) -> None:
+        """Set the state attributes, which only change with the external sensor"""
+        if self._external_sensor:
+            self._attr_extra_state_attributes = {
+                "external_sensor": self._external_sensor,
+                # "history_max": self._history.max,
+                # "history_min": self._history.min,
+            }
+        else:
+            self._attr_extra_state_attributes = None
+
+    @callback
+    def _async_track_entities(self) -> None:
+        """Track state_changed of the meter and its external sensor with one listener"""
+        entity_ids = {self.entity_id}
+        if self._external_sensor:
+            entity_ids.add(self._external_sensor)
+        if entity_ids == self._tracker:
+            return
+
+        # Replace the old listener, so a previous external sensor is no longer tracked
+        if self._unsub_tracker:
+            self._unsub_tracker()
+        self._unsub_tracker = async_track_state_change_event(
+            self._hass, list(entity_ids), self._state_changed_event
+        )
+        self._tracker = entity_ids
+
+    @callback
+    def _async_untrack_entities(self) -> None:
+        """Stop tracking state_changed, so a re-added meter subscribes again"""
+        if self._unsub_tracker:
+            self._unsub_tracker()
+            self._unsub_tracker = None
+        self._tracker = set()
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
         await super().async_added_to_hass()
+        self._added = True
         state = await self.async_get_last_state()
 
         # We do not restore the state for these.
         # They are read from the external sensor anyway
         self._attr_native_value = None
-        if state:
-            if "external_sensor" in state.attributes:
-                self.replace_external_sensor(state.attributes["external_sensor"])
-        self.async_track_entity(self.entity_id)
-        if self.external_sensor:
-            self.async_track_entity(self.external_sensor)
-
-        async_dispatcher_connect(
-            self._hass, DATA_UPDATED, self._schedule_immediate_update
+        if state and "external_sensor" in state.attributes:
+            # Restored before the first subscription, so we subscribe only once
+            self._external_sensor = state.attributes["external_sensor"] or None
+            self._update_external_attributes()
+        self._async_track_entities()
+        self.async_on_remove(self._async_untrack_entities)
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self._hass, DATA_UPDATED, self._schedule_immediate_update
+            )
         )
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Handle entity which will be removed."""
+        self._added = False
+        await super().async_will_remove_from_hass()
+
     async def async_update(self) -> None:
         """Set state and unit to the parent sensor state and unit"""
-        if self.external_sensor:
-            try:
-                self._attr_native_value = float(
-                    self._hass.states.get(self.external_sensor).state
-                )
-                if (
-                    ATTR_UNIT_OF_MEASUREMENT
-                    in self._hass.states.get(self.external_sensor).attributes
-                ):
-                    self._attr_native_unit_of_measurement = self._hass.states.get(
-                        self.external_sensor
-                    ).attributes[ATTR_UNIT_OF_MEASUREMENT]
-            except AttributeError:
-                _LOGGER.debug(
-                    "Unknown external sensor for %s: %s, setting to default: %s",
-                    self.entity_id,
-                    self.external_sensor,
-                    self._default_state,
-                )
-                self._attr_native_value = self._default_state
-            except ValueError:
-                _LOGGER.debug(
-                    "Unknown external value for %s: %s = %s, setting to default: %s",
-                    self.entity_id,
-                    self.external_sensor,
-                    self._hass.states.get(self.external_sensor).state,
-                    self._default_state,
-                )
-                self._attr_native_value = self._default_state
+        self._recompute()
 
-        else:
+    @callback
+    def _recompute(self) -> None:
+        """Set state and unit from the current state of the external sensor"""
+        if not self._external_sensor:
             _LOGGER.debug(
                 "External sensor not set for %s, setting to default: %s",
                 self.entity_id,
                 self._default_state,
             )
             self._attr_native_value = self._default_state
+            return
+        self._update_from_state(self._hass.states.get(self._external_sensor))
+
+    @callback
+    def _update_from_state(self, external_state: State | None) -> None:
+        """Set state and unit from a state of the external sensor"""
+        if external_state is None:
+            _LOGGER.debug(
+                "Unknown external sensor for %s: %s, setting to default: %s",
+                self.entity_id,
+                self._external_sensor,
+                self._default_state,
+            )
+            self._attr_native_value = self._default_state
+            return
+
+        try:
+            self._attr_native_value = float(external_state.state)
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Unknown external value for %s: %s = %s, setting to default: %s",
+                self.entity_id,
+                self._external_sensor,
+                external_state.state,
+                self._default_state,
+            )
+            self._attr_native_value = self._default_state
+            return
+
+        unit = external_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if unit:
+            self._attr_native_unit_of_measurement = unit
 
     @callback
-    def _schedule_immediate_update(self):
-        self.async_schedule_update_ha_state(True)
+    def _schedule_immediate_update(self) -> None:
+        """Recalculate and write the state right away, without an update task"""
+        self._recompute()
+        self.async_write_ha_state()
 
     @callback
     def _state_changed_event(self, event):
@@ -287,11 +320,13 @@ class PlantCurrentStatus(RestoreSensor):
     @callback
     def state_changed(self, entity_id, new_state):
         """Run on every update to allow for changes from the GUI and service call"""
-        if not self.hass.states.get(self.entity_id):
+        if not self._added:
             return
         if entity_id == self.entity_id:
-            current_attrs = self.hass.states.get(self.entity_id).attributes
-            if current_attrs.get("external_sensor") != self.external_sensor:
+            if new_state is None:
+                return
+            current_attrs = new_state.attributes
+            if current_attrs.get("external_sensor") != self._external_sensor:
                 self.replace_external_sensor(current_attrs.get("external_sensor"))
 
             if (
@@ -300,24 +335,18 @@ class PlantCurrentStatus(RestoreSensor):
             ):
                 self._attr_icon = new_state.attributes[ATTR_ICON]
 
-        if (
-            self.external_sensor
-            and new_state
-            and new_state.state != STATE_UNKNOWN
-            and new_state.state != STATE_UNAVAILABLE
-        ):
-            self._attr_native_value = new_state.state
-            if ATTR_UNIT_OF_MEASUREMENT in new_state.attributes:
-                self._attr_native_unit_of_measurement = new_state.attributes[
-                    ATTR_UNIT_OF_MEASUREMENT
-                ]
+        if self._external_sensor and entity_id == self._external_sensor:
+            # The event already carries the new state of the external sensor
+            self._update_from_state(new_state)
         else:
-            self._attr_native_value = self._default_state
+            self._recompute()
 
 
 class PlantCurrentIlluminance(PlantCurrentStatus):
     """Entity class for the current illuminance meter"""
 
+    _attr_device_class = SensorDeviceClass.ILLUMINANCE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -334,15 +363,13 @@ class PlantCurrentIlluminance(PlantCurrentStatus):
         self._attr_native_unit_of_measurement = LIGHT_LUX
         super().__init__(hass, config, plantdevice)
 
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return SensorDeviceClass.ILLUMINANCE
-
 
 class PlantCurrentConductivity(PlantCurrentStatus):
     """Entity class for the current conductivity meter"""
 
+    # Not a Home Assistant device class
+    _attr_device_class = ATTR_CONDUCTIVITY
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -360,15 +387,12 @@ class PlantCurrentConductivity(PlantCurrentStatus):
 
         super().__init__(hass, config, plantdevice)
 
-    @property
-    def device_class(self) -> None:
-        """Device class - not defined for conductivity"""
-        return ATTR_CONDUCTIVITY
-
 
 class PlantCurrentMoisture(PlantCurrentStatus):
     """Entity class for the current moisture meter"""
 
+    _attr_device_class = ATTR_MOISTURE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -384,15 +408,12 @@ class PlantCurrentMoisture(PlantCurrentStatus):
 
         super().__init__(hass, config, plantdevice)
 
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return ATTR_MOISTURE
-
 
 class PlantCurrentTemperature(PlantCurrentStatus):
     """Entity class for the current temperature meter"""
 
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -409,15 +430,12 @@ class PlantCurrentTemperature(PlantCurrentStatus):
         self._attr_suggested_display_precision = 1
         super().__init__(hass, config, plantdevice)
 
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return SensorDeviceClass.TEMPERATURE
-
 
 class PlantCurrentHumidity(PlantCurrentStatus):
     """Entity class for the current humidity meter"""
 
+    _attr_device_class = SensorDeviceClass.HUMIDITY
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -432,15 +450,13 @@ class PlantCurrentHumidity(PlantCurrentStatus):
         self._attr_suggested_display_precision = 1
         super().__init__(hass, config, plantdevice)
 
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return SensorDeviceClass.HUMIDITY
-
 
 class PlantCurrentPpfd(PlantCurrentStatus):
     """Entity reporting current PPFD calculated from LX"""
 
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_visible_default = False
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -461,20 +477,6 @@ class PlantCurrentPpfd(PlantCurrentStatus):
             f"{DOMAIN_SENSOR}.{{}}", self.name, current_ids={}
         )
 
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return None
-
-    @property
-    def entity_category(self) -> str:
-        """The entity category"""
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def entity_registry_visible_default(self) -> str:
-        return False
-
     def ppfd(self, value: float | int | str) -> float | str:
         """
         Returns a calculated PPFD-value from the lx-value
@@ -483,16 +485,14 @@ class PlantCurrentPpfd(PlantCurrentStatus):
         https://www.apogeeinstruments.com/conversion-ppfd-to-lux/
         μmol/m²/s
         """
-        if value is not None and value != STATE_UNAVAILABLE and value != STATE_UNKNOWN:
-            value = float(value) * DEFAULT_LUX_TO_PPFD / 1000000
-        else:
-            value = None
+        if value is None or value in UNAVAILABLE_STATES:
+            return None
+        return float(value) * _PPFD_SCALE
 
-        return value
-
-    async def async_update(self) -> None:
-        """Run on every update to allow for changes from the GUI and service call"""
-        if not self.hass.states.get(self.entity_id):
+    @callback
+    def _recompute(self) -> None:
+        """Set the PPFD from the current state of the illuminance meter"""
+        if not self._added:
             return
         if self.external_sensor != self._plant.sensor_illuminance.entity_id:
             self.replace_external_sensor(self._plant.sensor_illuminance.entity_id)
@@ -508,23 +508,23 @@ class PlantCurrentPpfd(PlantCurrentStatus):
     @callback
     def state_changed(self, entity_id: str, new_state: str) -> None:
         """Run on every update to allow for changes from the GUI and service call"""
-        if not self.hass.states.get(self.entity_id):
+        if not self._added:
             return
-        if self._external_sensor != self._plant.sensor_illuminance.entity_id:
-            self.replace_external_sensor(self._plant.sensor_illuminance.entity_id)
-        if self.external_sensor:
-            external_sensor = self.hass.states.get(self.external_sensor)
-            if external_sensor:
-                self._attr_native_value = self.ppfd(external_sensor.state)
-            else:
-                self._attr_native_value = None
-        else:
-            self._attr_native_value = None
+        if entity_id == self.entity_id:
+            # Our own state write, the meter is synced in _recompute
+            return
+        old_value = self._attr_native_value
+        self._recompute()
+        if self._attr_native_value != old_value:
+            self.async_write_ha_state()
 
 
 class PlantTotalLightIntegral(IntegrationSensor):
     """Entity class to calculate PPFD from LX"""
 
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_visible_default = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -544,29 +544,17 @@ class PlantTotalLightIntegral(IntegrationSensor):
             unit_time=UnitOfTime.SECONDS,
             max_sub_interval=None,
         )
+        # IntegrationSensor reports its unit from _unit_of_measurement
         self._unit_of_measurement = UNIT_DLI
         self._attr_icon = ICON_DLI
         self.entity_id = async_generate_entity_id(
             f"{DOMAIN_SENSOR}.{{}}", self.name, current_ids={}
         )
         self._plant = plantdevice
-
-    @property
-    def entity_category(self) -> str:
-        """The entity category"""
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def device_info(self) -> dict:
-        """Device info for devices"""
-        return {
-            "identifiers": {(DOMAIN, self._plant.unique_id)},
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, plantdevice.unique_id)},
         }
 
-    @property
-    def entity_registry_visible_default(self) -> str:
-        return False
-
     def _unit(self, source_unit: str) -> str:
         """Override unit"""
         return self._unit_of_measurement
@@ -609,18 +597,14 @@ class PlantDailyLightIntegral(UtilityMeterSensor):
         self._attr_icon = ICON_DLI
         self._attr_suggested_display_precision = 2
         self._plant = plantdevice
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, plantdevice.unique_id)},
+        }
 
     @property
     def device_class(self) -> str:
         return ATTR_DLI
 
-    @property
-    def device_info(self) -> dict:
-        """Device info for devices"""
-        return {
-            "identifiers": {(DOMAIN, self._plant.unique_id)},
-        }
-
 
 class PlantDummyStatus(SensorEntity):
     """Simple dummy sensors. Parent class"""
@@ -650,6 +634,10 @@ class PlantDummyStatus(SensorEntity):
 class PlantDummyIlluminance(PlantDummyStatus):
     """Dummy sensor"""
 
+    _attr_device_class = SensorDeviceClass.ILLUMINANCE
+    _attr_icon = ICON_ILLUMINANCE
+    _attr_native_unit_of_measurement = LIGHT_LUX
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -658,30 +646,29 @@ class PlantDummyIlluminance(PlantDummyStatus):
             f"Dummy {config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_ILLUMINANCE}"
         )
         self._attr_unique_id = f"{config.entry_id}-dummy-illuminance"
-        self._attr_icon = ICON_ILLUMINANCE
-        self._attr_native_unit_of_measurement = LIGHT_LUX
-        self._attr_native_value = random.randint(20, 50) * 1000
+        self._attr_native_value = _randrange(20000, 50001, 1000)
 
         super().__init__(hass, config, plantdevice)
 
     async def async_update(self) -> int:
         """Give out a dummy value"""
-        if datetime.now().hour < 5:
-            self._attr_native_value = random.randint(1, 10) * 100
-        elif datetime.now().hour < 15:
-            self._attr_native_value = random.randint(20, 50) * 1000
+        hour = datetime.now().hour
+        if hour < 5:
+            self._attr_native_value = _randrange(100, 1001, 100)
+        elif hour < 15:
+            self._attr_native_value = _randrange(20000, 50001, 1000)
         else:
-            self._attr_native_value = random.randint(1, 10) * 100
-
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return SensorDeviceClass.ILLUMINANCE
+            self._attr_native_value = _randrange(100, 1001, 100)
 
 
 class PlantDummyConductivity(PlantDummyStatus):
     """Dummy sensor"""
 
+    # Not a Home Assistant device class
+    _attr_device_class = ATTR_CONDUCTIVITY
+    _attr_icon = ICON_CONDUCTIVITY
+    _attr_native_unit_of_measurement = UNIT_CONDUCTIVITY
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -690,25 +677,22 @@ class PlantDummyConductivity(PlantDummyStatus):
             f"Dummy {config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_CONDUCTIVITY}"
         )
         self._attr_unique_id = f"{config.entry_id}-dummy-conductivity"
-        self._attr_icon = ICON_CONDUCTIVITY
-        self._attr_native_unit_of_measurement = UNIT_CONDUCTIVITY
-        self._attr_native_value = random.randint(40, 200) * 10
+        self._attr_native_value = _randrange(400, 2001, 10)
 
         super().__init__(hass, config, plantdevice)
 
     async def async_update(self) -> int:
         """Give out a dummy value"""
-        self._attr_native_value = random.randint(40, 200) * 10
-
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return ATTR_CONDUCTIVITY
+        self._attr_native_value = _randrange(400, 2001, 10)
 
 
 class PlantDummyMoisture(PlantDummyStatus):
     """Dummy sensor"""
 
+    _attr_device_class = ATTR_MOISTURE
+    _attr_icon = ICON_MOISTURE
+    _attr_native_unit_of_measurement = PERCENTAGE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -717,25 +701,22 @@ class PlantDummyMoisture(PlantDummyStatus):
             f"Dummy {config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_MOISTURE}"
         )
         self._attr_unique_id = f"{config.entry_id}-dummy-moisture"
-        self._attr_icon = ICON_MOISTURE
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_native_value = random.randint(10, 70)
+        self._attr_native_value = _randrange(10, 71)
 
         super().__init__(hass, config, plantdevice)
 
     async def async_update(self) -> None:
         """Give out a dummy value"""
-        self._attr_native_value = random.randint(10, 70)
-
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return ATTR_MOISTURE
+        self._attr_native_value = _randrange(10, 71)
 
 
 class PlantDummyTemperature(PlantDummyStatus):
     """Dummy sensor"""
 
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_icon = ICON_TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -745,25 +726,22 @@ class PlantDummyTemperature(PlantDummyStatus):
             f"Dummy {config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_TEMPERATURE}"
         )
         self._attr_unique_id = f"{config.entry_id}-dummy-temperature"
-        self._attr_icon = ICON_TEMPERATURE
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_native_value = random.randint(15, 20)
+        self._attr_native_value = _randrange(15, 21)
 
         super().__init__(hass, config, plantdevice)
 
     async def async_update(self) -> int:
         """Give out a dummy value"""
-        self._attr_native_value = random.randint(15, 20)
-
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return SensorDeviceClass.TEMPERATURE
+        self._attr_native_value = _randrange(15, 21)
 
 
 class PlantDummyHumidity(PlantDummyStatus):
     """Dummy sensor"""
 
+    _attr_device_class = SensorDeviceClass.HUMIDITY
+    _attr_icon = ICON_HUMIDITY
+    _attr_native_unit_of_measurement = PERCENTAGE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -772,18 +750,11 @@ class PlantDummyHumidity(PlantDummyStatus):
             f"Dummy {config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_HUMIDITY}"
         )
         self._attr_unique_id = f"{config.entry_id}-dummy-humidity"
-        self._attr_icon = ICON_HUMIDITY
-        self._attr_native_unit_of_measurement = PERCENTAGE
         super().__init__(hass, config, plantdevice)
-        self._attr_native_value = random.randint(25, 90)
+        self._attr_native_value = _randrange(25, 91)
 
     async def async_update(self) -> int:
         """Give out a dummy value"""
-        test = random.randint(0, 100)
+        test = _randrange(101)
         if test > 50:
-            self._attr_native_value = random.randint(25, 90)
-
-    @property
-    def device_class(self) -> str:
-        """Device class"""
-        return SensorDeviceClass.HUMIDITY
+            self._attr_native_value = _randrange(25, 91)
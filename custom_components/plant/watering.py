@@ -12,12 +12,51 @@ Formulas are intentionally conservative and well-tested; exact multipliers are T
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+from math import cos, pi
+import time
 from typing import Optional
 
 # Small safety bounds
 MIN_INTERVAL_DAYS = 0.5
 MAX_INTERVAL_DAYS = 365
 
+# Weather attributes holding the precipitation, in order of preference
+_PROBABILITY_KEYS = (
+    "precipitation_probability",
+    "precip_prob",
+    "precipitationProbability",
+)
+_AMOUNT_KEYS = ("precipitation", "precipitation_amount")
+# A forecast entry without any of these has no dryness to contribute
+_FORECAST_KEYS = frozenset((*_PROBABILITY_KEYS, *_AMOUNT_KEYS, "condition"))
+
+# Dryness of a weather condition, wet ones include the Home Assistant weather states
+_DRY_CONDITIONS = frozenset(("clear", "sunny", "partlycloudy", "mostly_sunny"))
+_MILD_CONDITIONS = frozenset(("cloudy", "partly_cloudy", "mostly_cloudy"))
+_WET_CONDITIONS = frozenset(
+    (
+        "rain",
+        "rainy",
+        "pouring",
+        "snow",
+        "snowy",
+        "snowy-rainy",
+        "sleet",
+        "hail",
+        "thunderstorm",
+        "lightning-rainy",
+    )
+)
+_CONDITION_DRYNESS = {
+    **dict.fromkeys(_DRY_CONDITIONS, 0.9),
+    **dict.fromkeys(_MILD_CONDITIONS, 0.6),
+    **dict.fromkeys(_WET_CONDITIONS, 0.1),
+}
+
+# Weather entity id -> (last_updated, dryness), shared by all plants
+_DRYNESS_CACHE: dict[str, tuple[datetime, Optional[float]]] = {}
+
 
 def _temp_modifier(temp_c: Optional[float]) -> float:
     """Return a multiplier for interval based on temperature in °C.
@@ -75,9 +114,12 @@ def _seasonal_modifier() -> float:
     Interval stays standard in Spring/Fall, shorter in Summer, longer in Winter.
     Helps for plants without accurate light sensors.
     """
-    from math import cos, pi
+    return _seasonal_by_day(time.gmtime().tm_yday)
+
 
-    day_of_year = datetime.utcnow().timetuple().tm_yday
+@lru_cache(maxsize=366)
+def _seasonal_by_day(day_of_year: int) -> float:
+    """Return the seasonal multiplier for a day of the year."""
     # Peak summer at day 172. Peak winter at day 355.
     # Returns 0.8 in Summer (peak) and 1.2 in Winter (peak)
     cos_val = cos(2 * pi * (day_of_year - 172) / 365.25)
@@ -102,6 +144,18 @@ def _clamp_interval(days: float) -> float:
     return max(MIN_INTERVAL_DAYS, min(MAX_INTERVAL_DAYS, days))
 
 
+def _as_float(value) -> Optional[float]:
+    """Return a numeric attribute as float, or None when it is not a number."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
 def weather_dryness_from_attrs(attrs: dict) -> Optional[float]:
     """Estimate a dryness index (0.0..1.0) from weather entity attributes.
 
@@ -119,48 +173,72 @@ def weather_dryness_from_attrs(attrs: dict) -> Optional[float]:
         count = 0
         # Blend current state with next 2 forecast periods
         for entry in forecast[:2]:
-            val = weather_dryness_from_attrs(entry)
+            if not entry or _FORECAST_KEYS.isdisjoint(entry):
+                continue
+            # Forecast entries are parsed without looking for a forecast in them
+            val = _attrs_dryness(entry)
             if val is not None:
                 dryness_sum += val
                 count += 1
         if count > 0:
-            # Recursive base case avoids infinite loop because 'forecast' won't be in 'entry'
             return dryness_sum / count
 
+    return _attrs_dryness(attrs)
+
+
+def _attrs_dryness(attrs: dict) -> Optional[float]:
+    """Estimate the dryness of a single set of weather attributes."""
     # Try precipitation probability fields
-    for key in ("precipitation_probability", "precip_prob", "precipitationProbability"):
-        if key in attrs:
-            try:
-                prob = float(attrs[key])
-                prob = max(0.0, min(100.0, prob))
-                return max(0.0, min(1.0, 1.0 - prob / 100.0))
-            except (ValueError, TypeError):
-                continue
+    for key in _PROBABILITY_KEYS:
+        prob = _as_float(attrs.get(key))
+        if prob is not None:
+            # Clamping to 0..100 already keeps the dryness within 0..1
+            return 1.0 - max(0.0, min(100.0, prob)) / 100.0
     # Try precipitation amount (higher -> wetter)
-    for key in ("precipitation", "precipitation_amount"):
-        if key in attrs:
-            try:
-                amount = float(attrs[key])
-                # Very naive mapping: 0 -> dry (1.0), high amounts -> wet (0.0)
-                return max(0.0, min(1.0, 1.0 - min(50.0, amount) / 50.0))
-            except (ValueError, TypeError):
-                continue
+    for key in _AMOUNT_KEYS:
+        amount = _as_float(attrs.get(key))
+        if amount is not None:
+            # Very naive mapping: 0 -> dry (1.0), high amounts -> wet (0.0)
+            return 1.0 - max(0.0, min(50.0, amount)) / 50.0
     # Check condition text as heuristic
     condition = (
         attrs.get("condition") if isinstance(attrs.get("condition"), str) else None
     )
     if condition:
-        cond = condition.lower()
-        if cond in ("clear", "sunny", "partlycloudy", "mostly_sunny"):
-            return 0.9
-        if cond in ("cloudy", "partly_cloudy", "mostly_cloudy"):
-            return 0.6
-        if cond in ("rain", "rainy", "snow", "sleet", "thunderstorm"):
-            return 0.1
+        # Home Assistant states are already lowercase
+        dryness = _CONDITION_DRYNESS.get(condition)
+        if dryness is None:
+            dryness = _CONDITION_DRYNESS.get(condition.lower())
+        return dryness
     # No useful info
     return None
 
 
+def _watering_modifiers(
+    temperature_c: Optional[float],
+    humidity_pct: Optional[float],
+    is_outside: bool,
+    weather_dryness: Optional[float],
+    dli: Optional[float],
+) -> tuple[float, float, float, float, float]:
+    """Return the temperature, humidity, outdoor, DLI and seasonal modifiers."""
+    season_mod = _seasonal_modifier()
+    if (
+        temperature_c is None
+        and humidity_pct is None
+        and dli is None
+        and not is_outside
+    ):
+        # No readings: every modifier but the season is neutral
+        return 1.0, 1.0, 1.0, 1.0, season_mod
+
+    temp_mod = _temp_modifier(temperature_c)
+    hum_mod = _humidity_modifier(humidity_pct)
+    out_mod = _outdoor_modifier(is_outside, weather_dryness)
+    dli_mod = _dli_modifier(dli)
+    return temp_mod, hum_mod, out_mod, dli_mod, season_mod
+
+
 def next_watering(
     last_watered: datetime,
     base_interval_days: float,
@@ -196,11 +274,9 @@ def next_watering(
     if base_interval_days is None:
         base_interval_days = 7.0
 
-    temp_mod = _temp_modifier(temperature_c)
-    hum_mod = _humidity_modifier(humidity_pct)
-    out_mod = _outdoor_modifier(is_outside, weather_dryness)
-    dli_mod = _dli_modifier(dli)
-    season_mod = _seasonal_modifier()
+    temp_mod, hum_mod, out_mod, dli_mod, season_mod = _watering_modifiers(
+        temperature_c, humidity_pct, is_outside, weather_dryness, dli
+    )
 
     combined = temp_mod * hum_mod * out_mod * dli_mod * season_mod
     interval = base_interval_days * combined
@@ -290,12 +366,22 @@ def get_weather_dryness(hass, weather_entity: Optional[str] = None) -> Optional[
         st = hass.states.get(weather_entity)
         if not st:
             return None
-        return weather_dryness_from_attrs(st.attributes)
+        return _state_dryness(st)
 
     # Fallback: try to find any weather entity
     for state in hass.states.async_all("weather"):
         if state and state.attributes:
-            val = weather_dryness_from_attrs(state.attributes)
+            val = _state_dryness(state)
             if val is not None:
                 return val
     return None
+
+
+def _state_dryness(state) -> Optional[float]:
+    """Return the dryness of a weather state, parsed once per state update."""
+    cached = _DRYNESS_CACHE.get(state.entity_id)
+    if cached is not None and cached[0] == state.last_updated:
+        return cached[1]
+    val = weather_dryness_from_attrs(state.attributes)
+    _DRYNESS_CACHE[state.entity_id] = (state.last_updated, val)
+    return val